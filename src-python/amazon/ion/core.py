@@ -15,6 +15,7 @@ from enum import IntEnum
 from typing import NamedTuple, Optional, Any, Union, Sequence, Coroutine
 
 from amazon.ion.symbols import SymbolToken
+from amazon.ion.util import _SharedCache
 
 # in Python 3.10, abstract collections have moved into their own module
 # for compatibility with 3.10+, first try imports from the new location
@@ -293,6 +294,18 @@ ION_VERSION_MARKER_EVENT = IonEvent(
     IonEventType.VERSION_MARKER, ion_type=None, value=(1, 0), depth=0
 )
 
+# Container end events carry only their container's type and depth, so one instance per combination is shared.
+_CONTAINER_END_EVENTS = _SharedCache()
+
+
+def _container_end_event(ion_type, depth):
+    """Returns the shared ``CONTAINER_END`` event for the given container type and depth."""
+    key = (ion_type, depth)
+    event = _CONTAINER_END_EVENTS.get(key)
+    if event is None:
+        event = _CONTAINER_END_EVENTS.share(key, IonEvent(IonEventType.CONTAINER_END, ion_type, depth=depth))
+    return event
+
 
 class DataEvent(NamedTuple):
     """Event generated as a result of the writer or as input into the reader.
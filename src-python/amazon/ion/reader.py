@@ -47,8 +47,8 @@ class CodePointArray:
             self.__text += values
         else:
             assert isinstance(values, bytes)
-            for b in iter(values):
-                self.append(b)
+            # Latin-1 maps each byte to the code point with the same ordinal, as ``append`` would.
+            self.__text += values.decode('latin-1')
 
     def as_symbol(self):
         return SymbolToken(self.__text, sid=None, location=None)
@@ -238,6 +238,115 @@ class BufferQueue(object):
             self.read(length, skip=True)
         return rem
 
+    def skip_until(self, targets):
+        """Removes buffered data up to, but not including, the first occurrence of any of the given characters.
+
+        If none of the characters are found, all buffered data up to EOF (if marked) is removed.
+
+        Args:
+            targets (sequence): Ordinals of the characters at which to stop.
+
+        Returns:
+            int: The number of bytes or code units removed.
+        """
+        needles = [self.__chr(target) for target in targets]
+        segments = self.__segments
+        offset = self.__offset
+        skipped = 0
+        while segments:
+            segment = segments[0]
+            if BufferQueue.is_eof(segment):
+                break
+            end = -1
+            for needle in needles:
+                idx = segment.find(needle, offset)
+                if idx >= 0 and (end < 0 or idx < end):
+                    end = idx
+            if end >= 0:
+                skipped += end - offset
+                offset = end
+                break
+            skipped += len(segment) - offset
+            offset = 0
+            segments.popleft()
+        self.__offset = offset
+        self.__size -= skipped
+        self.position += skipped
+        return skipped
+
+    def read_match(self, pattern):
+        """Consumes the data matched by the given pattern at the current position of the first segment.
+
+        Matches never span segments, so callers must be prepared to continue reading after a partial match.
+
+        Args:
+            pattern (re.Pattern): A compiled pattern of the same type (bytes or unicode) as this queue's data.
+
+        Returns:
+            bytes|unicode: The matched data, which is empty if there was no match.
+        """
+        segments = self.__segments
+        if not segments or BufferQueue.is_eof(segments[0]):
+            return self.__element_type()
+        segment = segments[0]
+        offset = self.__offset
+        match = pattern.match(segment, offset)
+        if match is None:
+            return self.__element_type()
+        end = match.end()
+        if end == len(segment):
+            segments.popleft()
+            self.__offset = 0
+        else:
+            self.__offset = end
+        length = end - offset
+        self.__size -= length
+        self.position += length
+        return match.group()
+
+    def read_byte_after(self, pattern):
+        """Consumes the data matched by the given pattern at the current position of the first segment, then reads
+        the byte that follows it, as ``read_match`` followed by ``read_byte`` would.
+
+        Args:
+            pattern (re.Pattern): A compiled pattern of the same type (bytes or unicode) as this queue's data.
+
+        Returns:
+            int|bytes|None: The byte (or code unit) following the match, or ``None`` if no data remains after it.
+        """
+        segments = self.__segments
+        if not segments:
+            return None
+        segment = segments[0]
+        offset = self.__offset
+        if not BufferQueue.is_eof(segment):
+            match = pattern.match(segment, offset)
+            if match is not None:
+                end = match.end()
+                length = end - offset
+                self.__size -= length
+                self.position += length
+                offset = end
+                if end == len(segment):
+                    segments.popleft()
+                    if not segments:
+                        self.__offset = 0
+                        return None
+                    segment = segments[0]
+                    offset = 0
+        if BufferQueue.is_eof(segment):
+            octet = _EOF
+        else:
+            octet = self.__ord(segment[offset])
+        offset += 1
+        if offset == len(segment):
+            offset = 0
+            segments.popleft()
+        self.__offset = offset
+        self.__size -= 1
+        self.position += 1
+        return octet
+
     def __iter__(self):
         while self.__size > 0:
             yield self.read_byte()
@@ -313,30 +422,34 @@ def reader_trampoline(start, allow_flush=False):
     data_event = yield
     if data_event is None or data_event.type is not ReadEventType.NEXT:
         raise TypeError('Reader must be started with NEXT')
-    trans = Transition(None, start)
+    delegate = start
     while True:
-        trans = trans.delegate.send(Transition(data_event, trans.delegate))
+        trans = delegate.send(Transition(data_event, delegate))
+        delegate = trans.delegate
+        event = trans.event
         data_event = None
-        if trans.event is not None:
+        if event is not None:
             # Only yield if there is an event.
-            data_event = (yield trans.event)
-            if trans.event.event_type.is_stream_signal:
-                if data_event.type is not ReadEventType.DATA:
-                    if not allow_flush or not (trans.event.event_type is IonEventType.INCOMPLETE and
-                                               data_event.type is ReadEventType.NEXT):
+            data_event = (yield event)
+            event_type = event.event_type
+            data_type = data_event.type
+            if event_type is IonEventType.INCOMPLETE or event_type is IonEventType.STREAM_END:
+                if data_type is not ReadEventType.DATA:
+                    if not allow_flush or not (event_type is IonEventType.INCOMPLETE and
+                                               data_type is ReadEventType.NEXT):
                         raise TypeError('Reader expected data: %r' % (data_event,))
             else:
-                if data_event.type is ReadEventType.DATA:
+                if data_type is ReadEventType.DATA:
                     raise TypeError('Reader did not expect data')
-            if data_event.type is ReadEventType.DATA and len(data_event.data) == 0:
+            if data_type is ReadEventType.DATA and len(data_event.data) == 0:
                 raise ValueError('Empty data not allowed')
-            if trans.event.depth == 0 \
-                    and trans.event.event_type is not IonEventType.CONTAINER_START \
-                    and data_event.type is ReadEventType.SKIP:
+            if event.depth == 0 \
+                    and event_type is not IonEventType.CONTAINER_START \
+                    and data_type is ReadEventType.SKIP:
                 raise TypeError('Cannot skip at the top-level')
 
 
-_DEFAULT_BUFFER_SIZE = 8196
+_DEFAULT_BUFFER_SIZE = 64 * 1024
 
 
 @coroutine
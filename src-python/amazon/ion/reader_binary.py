@@ -11,21 +11,20 @@
 # OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the
 # License.
-from collections import deque
 from datetime import timedelta
 from decimal import Decimal, localcontext
 from enum import IntEnum
 from functools import partial
 from io import BytesIO
 from struct import unpack
-from typing import NamedTuple, Optional, Sequence, Callable, Tuple, List
+from typing import NamedTuple, Optional, Sequence, Callable, List
 
 from .core import ION_STREAM_INCOMPLETE_EVENT, ION_STREAM_END_EVENT, ION_VERSION_MARKER_EVENT, \
     IonEventType, IonType, IonEvent, IonThunkEvent, \
-    TimestampPrecision, Timestamp, OffsetTZInfo
+    TimestampPrecision, Timestamp, OffsetTZInfo, _container_end_event
 from .exceptions import IonException
 from .sliceable_buffer import SliceableBuffer, IncompleteReadError
-from .util import coroutine
+from .util import coroutine, _SharedCache
 from .reader import ReadEventType
 from .symbols import SYMBOL_ZERO_TOKEN, SymbolToken
 
@@ -119,6 +118,9 @@ _FLOAT_LN_TABLE = {
 
 _CONTAINER_TIDS = (_TypeID.LIST, _TypeID.SEXP, _TypeID.STRUCT)
 
+# Strings encoded in at most this many bytes are decoded when read; longer strings are decoded on first access.
+_EAGER_STRING_LENGTH = 64
+
 
 def _gen_type_octet(hn, ln):
     """Generates a type octet from a high nibble and low nibble."""
@@ -159,24 +161,14 @@ def _parse_signed_int_components(buf):
     Returns:
         Returns a pair of the sign bit and the unsigned magnitude.
     """
+    data = buf.read()
+    if not data:
+        return 0, 0
+    value = int.from_bytes(data, 'big')
     sign_bit = 0
-    value = 0
-
-    first = True
-    while True:
-        ch = buf.read(1)
-        if ch == b'':
-            break
-        octet = ord(ch)
-        if first:
-            if octet & _SIGNED_INT_SIGN_MASK:
-                sign_bit = 1
-            value = octet & _SIGNED_INT_SIGN_VALUE_MASK
-            first = False
-        else:
-            value <<= 8
-            value |= octet
-
+    if data[0] & _SIGNED_INT_SIGN_MASK:
+        sign_bit = 1
+        value ^= _SIGNED_INT_SIGN_MASK << (8 * (len(data) - 1))
     return sign_bit, value
 
 
@@ -211,6 +203,8 @@ def _parse_sid_iter(data):
 class _ParserContext(NamedTuple):
     buffer: SliceableBuffer
     depth: int
+    # The field name of a struct item, which handlers build into the value's event.
+    field_name: Optional[SymbolToken] = None
 
 
 def _invalid_handler(type_octet, ctx):
@@ -242,13 +236,13 @@ def _var_uint_field_handler(handler, context: _ParserContext):
 
     Return the parse result from the field handler.
     """
-    (buffer, depth) = context
+    (buffer, depth, field_name) = context
     length, buffer = _var_uint_parser(buffer)
-    return handler(length, _ParserContext(buffer, depth))
+    return handler(length, _ParserContext(buffer, depth, field_name))
 
 
 def _ivm_handler(context: _ParserContext):
-    (buffer, depth) = context
+    (buffer, depth, _) = context
     if depth != 0:
         raise IonException("Ion version markers are only valid at the top-level!")
 
@@ -270,13 +264,24 @@ def _nop_pad_handler(_, length, context: _ParserContext):
     return None, buffer
 
 
-def _static_scalar_handler(ion_type, value, context: _ParserContext):
-    return IonEvent(IonEventType.SCALAR, ion_type, value, depth=context.depth), context.buffer
+def _static_scalar_handler(ion_type, value, events, context: _ParserContext):
+    """Handles scalars whose value is fully determined by the type octet.
+
+    One event is shared for each depth; ``events`` maps depth to event for a single type octet. Struct items carry a
+    field name, so theirs are built individually.
+    """
+    (buffer, depth, field_name) = context
+    if field_name is not None:
+        return IonEvent(IonEventType.SCALAR, ion_type, value, field_name, depth=depth), buffer
+    event = events.get(depth)
+    if event is None:
+        event = events.share(depth, IonEvent(IonEventType.SCALAR, ion_type, value, depth=depth))
+    return event, buffer
 
 
 def _length_scalar_handler(scalar_factory, ion_type, length, context: _ParserContext):
     """Handles scalars, ``scalar_factory`` is a function that returns a value or thunk."""
-    (buffer, depth) = context
+    (buffer, depth, field_name) = context
     if length == 0:
         data = b''
     else:
@@ -284,15 +289,15 @@ def _length_scalar_handler(scalar_factory, ion_type, length, context: _ParserCon
 
     scalar = scalar_factory(data)
     if callable(scalar):
-        event = IonThunkEvent(IonEventType.SCALAR, ion_type, scalar, depth=context.depth)
+        event = IonThunkEvent(IonEventType.SCALAR, ion_type, scalar, field_name, depth=depth)
     else:
-        event = IonEvent(IonEventType.SCALAR, ion_type, scalar, depth=context.depth)
+        event = IonEvent(IonEventType.SCALAR, ion_type, scalar, field_name, depth=depth)
 
     return event, buffer
 
 
 def _annotation_handler(_, length, context: _ParserContext):
-    (buffer, depth) = context
+    (buffer, depth, field_name) = context
     init_size = buffer.size
     anno_length, buffer = _var_uint_parser(buffer)
 
@@ -305,7 +310,7 @@ def _annotation_handler(_, length, context: _ParserContext):
     if length - (init_size - buffer.size) < 1:
         raise IonException("Invalid annotation length subfield; annotation wrapper must wrap non-zero length value.")
 
-    event, buffer = _tlv_parser(_ParserContext(buffer, depth))
+    event, buffer = _tlv_parser(_ParserContext(buffer, depth, field_name))
 
     # nop padding comes back as none
     if event is None:
@@ -327,19 +332,21 @@ def _annotation_handler(_, length, context: _ParserContext):
 def _ordered_struct_start_handler(length, context: _ParserContext):
     if length < 2:
         raise IonException('Ordered structs (type ID 0xD1) must have at least one field name/value pair.')
-    return IonEvent(IonEventType.CONTAINER_START, IonType.STRUCT, value=length, depth=context.depth), context.buffer
+    (buffer, depth, field_name) = context
+    return IonEvent(IonEventType.CONTAINER_START, IonType.STRUCT, length, field_name, depth=depth), buffer
 
 
 def _container_start_handler(ion_type, length, context: _ParserContext):
     # todo: consider extension event to smuggle limit out!
-    return IonEvent(IonEventType.CONTAINER_START, ion_type, value=length, depth=context.depth), context.buffer
+    (buffer, depth, field_name) = context
+    return IonEvent(IonEventType.CONTAINER_START, ion_type, length, field_name, depth=depth), buffer
 
 
 def _ivm_parser(context: _ParserContext):
     """
     Parse and verify an IVM; used only at start of stream.
     """
-    (buffer, depth) = context[0:3]
+    (buffer, depth, _) = context
     (type_octet, buffer) = buffer.read_byte()
     if type_octet != _IVM_START_OCTET:
         raise IonException(
@@ -354,30 +361,41 @@ def _tlv_parser(context: _ParserContext):
 
     Validation that IVMs are only at the top-level is in the _ivm_handler.
     """
-    (buffer, depth) = context
+    (buffer, depth, field_name) = context
     (tid, buffer) = buffer.read_byte()
-    return _HANDLER_DISPATCH_TABLE[tid](_ParserContext(buffer, depth))
+    return _HANDLER_DISPATCH_TABLE[tid](_ParserContext(buffer, depth, field_name))
+
+
+_SID_TOKENS = _SharedCache()
+
+
+def _sid_token(sid):
+    """Returns a :class:`SymbolToken` with no text for the given symbol ID, reusing any token previously created for it.
+
+    Field names and symbol values repeat heavily within a stream, so sharing their tokens saves an allocation per use.
+    """
+    token = _SID_TOKENS.get(sid)
+    if token is None:
+        token = _SID_TOKENS.share(sid, SymbolToken(None, sid))
+    return token
 
 
 def _struct_item_parser(context: _ParserContext):
     """
     Parse the field and value for an item in a struct.
     """
-    (buffer, depth) = context
+    (buffer, depth, _) = context
     field_sid, buffer = _var_uint_parser(buffer)
-    event, buffer = _tlv_parser(_ParserContext(buffer, depth))
+    # The field name is passed down so that the value's event is built with it, rather than derived afterwards.
+    return _tlv_parser(_ParserContext(buffer, depth, _sid_token(field_sid)))
 
-    if not event:
-        return event, buffer
-    else:
-        return event.derive_field_name(SymbolToken(None, field_sid)), buffer
 
-
-class _ContextFrame(NamedTuple):
-    parser: Callable[[_ParserContext], Tuple[IonEvent, SliceableBuffer]]
-    ion_type: Optional[IonType]
-    depth: int
-    limit: int
+# The parser for the items of each container type, indexed by IonType.
+_CONTAINER_ITEM_PARSERS = [None] * len(IonType)
+_CONTAINER_ITEM_PARSERS[IonType.LIST] = _tlv_parser
+_CONTAINER_ITEM_PARSERS[IonType.SEXP] = _tlv_parser
+_CONTAINER_ITEM_PARSERS[IonType.STRUCT] = _struct_item_parser
+_CONTAINER_ITEM_PARSERS = tuple(_CONTAINER_ITEM_PARSERS)
 
 
 @coroutine
@@ -386,14 +404,21 @@ def stream_handler():
     Handler for an Ion Binary value-stream.
     """
     buffer = SliceableBuffer.empty()
+    # The context stack is kept as parallel lists (parser, container type,
+    # limit) rather than a stack of frame objects, so pushing and popping a
+    # container never allocates. The depth is the number of open containers.
     # top-level context limit is -1 to denote no limit
-    context_stack = deque([_ContextFrame(_tlv_parser, None, 0, -1)])
+    parsers = [_tlv_parser]
+    parent_types = [None]
+    limits = [-1]
     cursor = 0
     ion_event = None
     skip_or_next = ReadEventType.NEXT
     expect_data = False
     # will get swapped out for tlv or struct parser in main loop
     parser = _ivm_parser
+    dispatch_table = _HANDLER_DISPATCH_TABLE
+    item_parsers = _CONTAINER_ITEM_PARSERS
     parent_type = None
     depth = 0
     limit = -1
@@ -441,14 +466,17 @@ def stream_handler():
         while not ion_event:
             # we might be at end of container
             if cursor == limit:
-                ion_event = IonEvent(
-                    IonEventType.CONTAINER_END,
-                    parent_type,
-                    depth=depth - 1)
+                ion_event = _container_end_event(parent_type, depth - 1)
             # parsing is fun, let's do that!
             else:
                 try:
-                    (ion_event, new_buff) = parser(_ParserContext(buffer, depth))
+                    if parser is _tlv_parser:
+                        # _tlv_parser inlined: dispatch on the type octet
+                        # directly, as most values are parsed this way.
+                        (tid, new_buff) = buffer.read_byte()
+                        (ion_event, new_buff) = dispatch_table[tid](_ParserContext(new_buff, depth))
+                    else:
+                        (ion_event, new_buff) = parser(_ParserContext(buffer, depth))
                     cursor += buffer.size - new_buff.size
                     buffer = new_buff
                     if 0 < limit < cursor:
@@ -459,25 +487,34 @@ def stream_handler():
                     else:
                         ion_event = ION_STREAM_INCOMPLETE_EVENT
 
-        event_type = ion_event.event_type
-        if event_type.is_stream_signal:
+        # Stream signals are only ever the shared INCOMPLETE and STREAM_END
+        # events, so identity suffices.
+        if ion_event is ION_STREAM_INCOMPLETE_EVENT or ion_event is ION_STREAM_END_EVENT:
             expect_data = True
         else:
             expect_data = False
+            event_type = ion_event.event_type
 
             if event_type is IonEventType.CONTAINER_START:
-                if ion_event.ion_type is IonType.STRUCT:
-                    parser = _struct_item_parser
-                else:
-                    parser = _tlv_parser
+                parent_type = ion_event.ion_type
+                parser = item_parsers[parent_type]
+                depth += 1
                 # we're appropriating "value" for the length of the container
-                frame = _ContextFrame(parser, ion_event.ion_type, depth + 1, cursor + ion_event.value)
-                context_stack.append(frame)
+                limit = cursor + ion_event.value
+                parsers.append(parser)
+                parent_types.append(parent_type)
+                limits.append(limit)
                 ion_event = ion_event.derive_value(None)
             elif event_type is IonEventType.CONTAINER_END:
-                context_stack.pop()
-
-            (parser, parent_type, depth, limit) = context_stack[-1]
+                parsers.pop()
+                parent_types.pop()
+                limits.pop()
+                parser = parsers[-1]
+                parent_type = parent_types[-1]
+                depth -= 1
+                limit = limits[-1]
+            else:
+                parser = parsers[-1]
 
 
 #
@@ -485,38 +522,9 @@ def stream_handler():
 #
 
 
-def _rslice(data, rem, size):
-    start = -rem
-    end = start + size
-    if end >= 0:
-        end = None
-    return data[slice(start, end)]
-
-
 def _int_factory(sign, data):
-    def parse_int():
-        value = 0
-        length = len(data)
-        while length >= 8:
-            segment = _rslice(data, length, 8)
-            value <<= 64
-            value |= unpack('>Q', segment)[0]
-            length -= 8
-        if length >= 4:
-            segment = _rslice(data, length, 4)
-            value <<= 32
-            value |= unpack('>I', segment)[0]
-            length -= 4
-        if length >= 2:
-            segment = _rslice(data, length, 2)
-            value <<= 16
-            value |= unpack('>H', segment)[0]
-            length -= 2
-        if length == 1:
-            value <<= 8
-            value |= data[-length]
-        return sign * value
-    return parse_int
+    # Magnitudes are decoded eagerly; int.from_bytes is cheaper than allocating a thunk for the deferred parse.
+    return sign * int.from_bytes(data, 'big')
 
 
 def _float_factory(data):
@@ -595,17 +603,20 @@ def _timestamp_factory(data):
 
 
 def _symbol_factory(data):
-    parse_sid = _int_factory(1, data)
+    return _sid_token(int.from_bytes(data, 'big'))
 
-    def parse_symbol():
-        sid = parse_sid()
-        return SymbolToken(None, sid)
 
-    return parse_symbol
+def _decode_string(data):
+    try:
+        return str(data, 'utf-8')
+    except UnicodeDecodeError as e:
+        raise IonException('Invalid UTF-8 in string value: %s' % e)
 
 
 def _string_factory(data):
-    return lambda: str(data, 'utf-8')
+    if len(data) <= _EAGER_STRING_LENGTH:
+        return _decode_string(data)
+    return lambda: _decode_string(data)
 
 
 def _lob_factory(data):
@@ -627,12 +638,12 @@ def _bind_null_handlers():
     for tid in _NULLABLE_TIDS:
         type_octet = _gen_type_octet(tid, _NULL_LN)
         ion_type = _TID_VALUE_TYPE_TABLE[tid]
-        _HANDLER_DISPATCH_TABLE[type_octet] = partial(_static_scalar_handler, ion_type, None)
+        _HANDLER_DISPATCH_TABLE[type_octet] = partial(_static_scalar_handler, ion_type, None, _SharedCache())
 
 
 def _bind_static_scalar_handlers():
     for type_octet, ion_type, value in _STATIC_SCALARS:
-        _HANDLER_DISPATCH_TABLE[type_octet] = partial(_static_scalar_handler, ion_type, value)
+        _HANDLER_DISPATCH_TABLE[type_octet] = partial(_static_scalar_handler, ion_type, value, _SharedCache())
 
 
 def _bind_length_handlers(tids, user_handler, lns):
@@ -23,7 +23,7 @@ from .symbols import SymbolTable, SymbolTableCatalog, \
                      LOCAL_TABLE_TYPE, SYSTEM_SYMBOL_TABLE, \
                      TEXT_ION, TEXT_ION_1_0, TEXT_ION_SYMBOL_TABLE, TEXT_SYMBOLS, TEXT_IMPORTS, \
                      TEXT_NAME, TEXT_VERSION, TEXT_MAX_ID
-from .util import coroutine
+from .util import coroutine, _SharedCache
 
 
 class _ManagedContext(NamedTuple):
@@ -94,6 +94,20 @@ class _IonManagedThunkEvent(IonThunkEvent):
         return IonThunkEvent.derive_field_name(self, field_name_thunk)
 
 
+_ANNOTATIONS = _SharedCache()
+
+
+def _intern_annotations(annotations):
+    """Returns a tuple equal to the given resolved annotations, reusing any equal tuple previously returned.
+
+    Annotation sequences tend to repeat across a stream, so values materialized from it can share one tuple.
+    """
+    interned = _ANNOTATIONS.get(annotations)
+    if interned is None:
+        interned = _ANNOTATIONS.share(annotations, annotations)
+    return interned
+
+
 def _managed_thunk_event(ctx, ion_event):
     event_type = ion_event.event_type
     ion_type = ion_event.ion_type
@@ -105,7 +119,10 @@ def _managed_thunk_event(ctx, ion_event):
         return field_name
 
     def annotations_thunk():
-        return tuple(ctx.resolve(annotation) for annotation in ion_event.annotations)
+        annotations = ion_event.annotations
+        if not annotations:
+            return ()
+        return _intern_annotations(tuple(ctx.resolve(annotation) for annotation in annotations))
 
     def value_thunk():
         value = ion_event.value
@@ -13,18 +13,18 @@
 # License.
 
 import base64
+import re
 from decimal import Decimal
-from collections import defaultdict
 from enum import IntEnum
 from functools import partial
 from typing import Optional, NamedTuple
 
 from amazon.ion.core import Transition, ION_STREAM_INCOMPLETE_EVENT, ION_STREAM_END_EVENT, IonType, IonEvent, \
-    IonEventType, IonThunkEvent, TimestampPrecision, timestamp, ION_VERSION_MARKER_EVENT
+    IonEventType, IonThunkEvent, TimestampPrecision, timestamp, ION_VERSION_MARKER_EVENT, _container_end_event
 from amazon.ion.exceptions import IonException
-from amazon.ion.reader import BufferQueue, reader_trampoline, ReadEventType, CodePointArray, CodePoint
+from amazon.ion.reader import BufferQueue, reader_trampoline, ReadEventType, CodePointArray, CodePoint, _EOF
 from amazon.ion.symbols import SymbolToken, TEXT_ION_1_0
-from amazon.ion.util import coroutine, _next_code_point, CodePoint
+from amazon.ion.util import coroutine, _next_code_point, CodePoint, _SURROGATE_START, _SURROGATE_END, _SharedCache
 
 
 def _illegal_character(c, ctx, message=''):
@@ -47,16 +47,6 @@ def _illegal_character(c, ctx, message=''):
                        % (header, ctx.queue.position, value_type, container_type, message, ctx.value))
 
 
-def _defaultdict(dct, fallback=_illegal_character):
-    """Wraps the given dictionary such that the given fallback function will be called when a nonexistent key is
-    accessed.
-    """
-    out = defaultdict(lambda: fallback)
-    for k, v in iter(dct.items()):
-        out[k] = v
-    return out
-
-
 def _merge_mappings(*args):
     """Merges a sequence of dictionaries and/or tuples into a single dictionary.
 
@@ -75,6 +65,22 @@ def _merge_mappings(*args):
     return dct
 
 
+_TABLE_SIZE = 256
+
+
+def _flatten(dct, fallback=_illegal_character):
+    """Flattens the given dictionary into a tuple indexed by character ordinal, such that the given fallback function
+    occupies every index that is not a key in the dictionary.
+
+    Ordinals that fall outside the table (i.e. those greater than or equal to ``_TABLE_SIZE``) must be handled by the
+    caller.
+    """
+    table = [fallback] * _TABLE_SIZE
+    for k, v in iter(dct.items()):
+        table[k] = v
+    return tuple(table)
+
+
 def _seq(s):
     """Converts bytes to a sequence of integer code points."""
     return tuple(iter(s))
@@ -106,6 +112,7 @@ _IDENTIFIER_CHARACTERS = _IDENTIFIER_STARTS + _DIGITS + _seq(b'$')
 _OPERATORS = _seq(b'!#%&*+-./;<=>?@^`|~')
 _COMMON_ESCAPES = _seq(b'abtnfrv?0\'"/\\')
 _NEWLINES = _seq(b'\r\n')
+_BLOCK_COMMENT_SCAN_TARGETS = _seq(b'*')
 
 _UNDERSCORE = ord(b'_')
 _DOT = ord(b'.')
@@ -146,6 +153,47 @@ _MAX_TEXT_CHAR = 0x10ffff
 _MAX_CLOB_CHAR = 0x7f
 _MIN_QUOTED_CHAR = 0x20
 
+# Bit flags for the character classes tested on every character by the hottest handlers. A single lookup in
+# _CHAR_CLASSES replaces a linear scan through one or more of the character sequences above.
+_CHAR_WHITESPACE = 0x01
+_CHAR_DIGIT = 0x02
+_CHAR_BASE64 = 0x04
+_CHAR_BASE64_PAD = 0x08
+_CHAR_OPERATOR = 0x10
+_CHAR_TERMINATOR = 0x20
+_CHAR_IDENTIFIER = 0x40
+_CHAR_HEX = 0x80
+_CHAR_IDENTIFIER_START = 0x100
+_CHAR_SYMBOL_TERMINATOR = 0x200
+
+
+def _char_classes():
+    """Builds the mapping of character ordinal to character class flags. Because text input may contain code points
+    outside of the single-byte range, the mapping has no fixed size. Characters it does not contain have no class, so
+    it is read with ``.get(c, 0)``, which keeps the table from growing with the input. The EOF sentinel terminates
+    values.
+    """
+    classes = {}
+    for chars, flag in (
+        (_WHITESPACE, _CHAR_WHITESPACE),
+        (_DIGITS, _CHAR_DIGIT),
+        (_BASE64_DIGITS, _CHAR_BASE64),
+        ((_BASE64_PAD,), _CHAR_BASE64_PAD),
+        (_OPERATORS, _CHAR_OPERATOR),
+        (_VALUE_TERMINATORS, _CHAR_TERMINATOR),
+        (_IDENTIFIER_CHARACTERS, _CHAR_IDENTIFIER),
+        (_HEX_DIGITS, _CHAR_HEX),
+        (_IDENTIFIER_STARTS, _CHAR_IDENTIFIER_START),
+        (_SYMBOL_TOKEN_TERMINATORS, _CHAR_SYMBOL_TERMINATOR),
+    ):
+        for c in chars:
+            classes[c] = classes.get(c, 0) | flag
+    classes[_EOF] = _CHAR_TERMINATOR
+    return classes
+
+
+_CHAR_CLASSES = _char_classes()
+
 # The following suffixes are used for comparison when a token is found that starts with the first letter in
 # the keyword. For example, when a new token starts with 't', the next three characters must match those in
 # _TRUE_SUFFIX, followed by an acceptable termination character, in order for the token to match the 'true' keyword.
@@ -153,7 +201,37 @@ _TRUE_SUFFIX = _seq(b'rue')
 _FALSE_SUFFIX = _seq(b'alse')
 _NAN_SUFFIX = _seq(b'an')
 _INF_SUFFIX = _seq(b'inf')
-_IVM_PREFIX = _seq(b'$ion_')
+
+# Tokens that begin with a dollar sign are scanned in runs of identifier characters, then classified as an IVM,
+# a symbol identifier, or a regular unquoted symbol once complete.
+_IVM_PREFIX = u'$ion_'
+_IVM_PATTERN = re.compile(r'\$ion_[0-9]*_[0-9]+')
+_SYMBOL_IDENTIFIER = re.compile(r'\$[0-9]+')
+_IDENTIFIER_RUN_BYTES = re.compile(b'[a-zA-Z0-9_$]+')
+_IDENTIFIER_RUN_TEXT = re.compile(u'[a-zA-Z0-9_$]+')
+_BASE64_PATTERN = re.compile(b'(?:[a-zA-Z0-9+/]{4})*(?:[a-zA-Z0-9+/]{3}=|[a-zA-Z0-9+/]{2}==)?')
+_BASE64_RUN_BYTES = re.compile(b'[a-zA-Z0-9+/=]+')
+_BASE64_RUN_TEXT = re.compile(u'[a-zA-Z0-9+/=]+')
+_WHITESPACE_RUN_BYTES = re.compile(b'[ \t\n\r\v\f]+')
+_WHITESPACE_RUN_TEXT = re.compile(u'[ \t\n\r\v\f]+')
+_TIMESTAMP_MONTH_DAY_BYTES = re.compile(b'[0-9]{2}-[0-9]{2}')
+_TIMESTAMP_MONTH_DAY_TEXT = re.compile(u'[0-9]{2}-[0-9]{2}')
+_DIGIT_RUNS = (re.compile(b'[0-9]+'), re.compile(u'[0-9]+'))
+_OPERATOR_RUNS = (re.compile(b'[!#%&*+\\-./;<=>?@^`|~]+'), re.compile(u'[!#%&*+\\-./;<=>?@^`|~]+'))
+# The remainders of the keywords, keyed by first character (for inf, the character following the sign). When the rest
+# of a keyword is already buffered, it is consumed in one step rather than compared one character at a time.
+_KEYWORD_SUFFIX_BYTES = {
+    _N_LOWER: re.compile(b'ull|an'),
+    _T_LOWER: re.compile(b'rue'),
+    _F_LOWER: re.compile(b'alse'),
+    _INF_SUFFIX[0]: re.compile(b'nf'),
+}
+_KEYWORD_SUFFIX_TEXT = {
+    _N_LOWER: re.compile(u'ull|an'),
+    _T_LOWER: re.compile(u'rue'),
+    _F_LOWER: re.compile(u'alse'),
+    _INF_SUFFIX[0]: re.compile(u'nf'),
+}
 
 _IVM_EVENTS = {
     TEXT_ION_1_0: ION_VERSION_MARKER_EVENT,
@@ -163,9 +241,17 @@ _POS_INF = float('+inf')
 _NEG_INF = float('-inf')
 _NAN = float('nan')
 
+# The type and value of each keyword that may be matched by _symbol_or_keyword_handler.
+_KEYWORD_VALUES = {
+    u'null': (IonType.NULL, None),
+    u'nan': (IonType.FLOAT, _NAN),
+    u'true': (IonType.BOOL, True),
+    u'false': (IonType.BOOL, False),
+}
+
 
 def _ends_value(c):
-    return c in _VALUE_TERMINATORS or BufferQueue.is_eof(c)
+    return _CHAR_CLASSES.get(c, 0) & _CHAR_TERMINATOR
 
 
 class _NullSequence:
@@ -263,10 +349,9 @@ _C_SEXP = _ContainerContext((_CLOSE_PAREN,), (), IonType.SEXP, False)
 
 def _is_escaped(c):
     """Queries whether a character ordinal or code point was part of an escape sequence."""
-    try:
-        return c.is_escaped
-    except AttributeError:
-        return False
+    # Escape sequences are resolved by the code point handler, which marks the resulting CodePoint; plain ordinals
+    # carry no escape state. A default lookup avoids raising and catching an exception for the common case.
+    return getattr(c, 'is_escaped', False)
 
 
 def _as_symbol(value, is_symbol_value=True):
@@ -291,6 +376,23 @@ def _as_symbol(value, is_symbol_value=True):
     return value
 
 
+# Field names recur across the structs of a stream, so their tokens are shared rather than rebuilt for every field.
+_FIELD_NAME_TOKENS = _SharedCache()
+
+
+def _as_field_name(value):
+    """Converts the input to a :class:`SymbolToken` suitable for use as a field name, reusing any token previously
+    created for the same text.
+    """
+    if not isinstance(value, CodePointArray):
+        return _as_symbol(value, is_symbol_value=False)
+    text = value.as_text()
+    token = _FIELD_NAME_TOKENS.get(text)
+    if token is None:
+        token = _FIELD_NAME_TOKENS.share(text, value.as_symbol())
+    return token
+
+
 class _HandlerContext():
     """A context for a handler co-routine.
 
@@ -488,7 +590,7 @@ class _HandlerContext():
         """Sets the context's ``pending_symbol`` as its ``field_name``."""
         assert self.pending_symbol is not None
         assert not self.value
-        self.field_name = _as_symbol(self.pending_symbol, is_symbol_value=False)  # pending_symbol becomes field name
+        self.field_name = _as_field_name(self.pending_symbol)  # pending_symbol becomes field name
         self.pending_symbol = None  # reset pending symbol
         self.quoted_text = False
         self.line_comment = False
@@ -544,6 +646,26 @@ class _CompositeTransition(Transition):
         self.next_context = next_context
 
 
+class _SingleStepHandler:
+    """Stands in for a handler coroutine that transitions away as soon as it receives one character, avoiding the cost
+    of creating and priming a generator for such short-lived handlers.
+
+    Args:
+        step (callable): Called with the received character's ordinal, the context, and ``args``; returns a Transition.
+        ctx (_HandlerContext): The context for the current token.
+    """
+    __slots__ = ('step', 'ctx', 'args')
+
+    def __init__(self, step, ctx, *args):
+        self.step = step
+        self.ctx = ctx
+        self.args = args
+
+    def send(self, value):
+        c, _ = value
+        return self.step(c, self.ctx, *self.args)
+
+
 def _decode(value):
     return value.decode(_ENCODING)
 
@@ -561,15 +683,24 @@ def _base_10(parse_func, value, base, decode=False):
     return parse_func(value)
 
 
-def _base_n(parse_func, value, base):
-    return parse_func(_decode(value), base)
+def _parse_decimal_int(value):
+    # int() and float() accept the token's bytes directly, so the thunk needs no decoding or wrapper frames.
+    return partial(int, value)
+
+
+def _parse_float(value):
+    return partial(float, value)
+
+
+def _parse_binary_int(value):
+    # int() accepts the radix prefix, sign, and underscores in the token's bytes, so no decoding pass is needed.
+    return partial(int, value, 2)
+
+
+def _parse_hex_int(value):
+    return partial(int, value, 16)
 
 
-# In Python 2, int() returns a long if the input overflows an int.
-_parse_decimal_int = partial(_parse_number, partial(_base_10, int))
-_parse_binary_int = partial(_parse_number, partial(_base_n, int), base=2)
-_parse_hex_int = partial(_parse_number, partial(_base_n, int), base=16)
-_parse_float = partial(_parse_number, partial(_base_10, float))
 _parse_decimal = partial(_parse_number, partial(_base_10, Decimal, decode=True))
 
 
@@ -583,7 +714,11 @@ def _number_negative_start_handler(c, ctx):
     ctx.set_ion_type(IonType.INT)
     ctx.value.append(c)
     c, _ = yield
-    yield ctx.immediate_transition(_NEGATIVE_TABLE[c](c, ctx))
+    if BufferQueue.is_eof(c) or c >= _TABLE_SIZE:
+        handler = _negative_inf_or_sexp_hyphen_handler
+    else:
+        handler = _NEGATIVE_TABLE[c]
+    yield ctx.immediate_transition(handler(c, ctx))
 
 
 @coroutine
@@ -601,7 +736,8 @@ def _number_zero_start_handler(c, ctx):
         if c == _SLASH:
             trans = ctx.immediate_transition(_number_slash_end_handler(c, ctx, trans))
         yield trans
-    yield ctx.immediate_transition(_ZERO_START_TABLE[c](c, ctx))
+    handler = _ZERO_START_TABLE[c] if c < _TABLE_SIZE else _illegal_character
+    yield ctx.immediate_transition(handler(c, ctx))
 
 
 @coroutine
@@ -611,8 +747,10 @@ def _number_or_timestamp_handler(c, ctx):
     """
     assert c in _DIGITS
     ctx.set_ion_type(IonType.INT)  # If this is the last digit read, this value is an Int.
+    queue = ctx.queue
     val = ctx.value
     val.append(c)
+    val.extend(_read_digit_run(queue, _DIGIT_RUNS))
     c, self = yield
     trans = ctx.immediate_transition(self)
     while True:
@@ -622,10 +760,12 @@ def _number_or_timestamp_handler(c, ctx):
             if c == _SLASH:
                 trans = ctx.immediate_transition(_number_slash_end_handler(c, ctx, trans))
         else:
-            if c not in _DIGITS:
-                trans = ctx.immediate_transition(_NUMBER_OR_TIMESTAMP_TABLE[c](c, ctx))
+            if not _CHAR_CLASSES.get(c, 0) & _CHAR_DIGIT:
+                handler = _NUMBER_OR_TIMESTAMP_TABLE[c] if c < _TABLE_SIZE else _illegal_character
+                trans = ctx.immediate_transition(handler(c, ctx))
             else:
                 val.append(c)
+                val.extend(_read_digit_run(queue, _DIGIT_RUNS))
         c, _ = yield trans
 
 
@@ -643,6 +783,15 @@ def _number_slash_end_handler(c, ctx, event):
     yield _CompositeTransition(event, ctx, comment, next_ctx, initialize_handler=False)
 
 
+def _read_digit_run(queue, patterns):
+    """Consumes the run of buffered characters matched by one of the given (bytes, unicode) patterns, returning it as
+    bytes so that it may extend a numeric token regardless of the type of input.
+    """
+    if queue.is_unicode:
+        return queue.read_match(patterns[1]).encode('ascii')
+    return queue.read_match(patterns[0])
+
+
 def _numeric_handler_factory(charset, transition, assertion, illegal_before_underscore, parse_func,
                              illegal_at_end=(None,), ion_type=None, append_first_if_not=None, first_char=None):
     """Generates a handler co-routine which tokenizes a numeric component (a token or sub-token).
@@ -667,11 +816,19 @@ def _numeric_handler_factory(charset, transition, assertion, illegal_before_unde
             particular character is peculiar to the Ion format (e.g. 'd' to denote the exponent of a decimal value
             should be replaced with 'e' for compatibility with python's Decimal type).
     """
+    # Runs of buffered characters in ``charset`` are appended in one step; underscores and every other character are
+    # still examined individually.
+    runs = tuple(re.compile(pattern) for pattern in (
+        b'[%s]+' % (bytes(charset),),
+        u'[%s]+' % (bytes(charset).decode('ascii'),),
+    ))
+
     @coroutine
     def numeric_handler(c, ctx):
         assert assertion(c, ctx)
         if ion_type is not None:
             ctx.set_ion_type(ion_type)
+        queue = ctx.queue
         val = ctx.value
         if c != append_first_if_not:
             first = c if first_char is None else first_char
@@ -695,6 +852,7 @@ def _numeric_handler_factory(charset, transition, assertion, illegal_before_unde
                         trans = transition(prev, c, ctx, trans)
                     else:
                         val.append(c)
+                        val.extend(_read_digit_run(queue, runs))
             prev = c
             c, _ = yield trans
     return numeric_handler
@@ -733,7 +891,7 @@ def _coefficient_handler_factory(trans_table, parse_func, assertion=lambda c, ct
     """Generates a handler co-routine which tokenizes a numeric coefficient.
 
     Args:
-        trans_table (dict): lookup table for the handler for the next component of this numeric token, given the
+        trans_table (tuple): lookup table for the handler for the next component of this numeric token, given the
             ordinal of the first character in that component.
         parse_func (callable): Called upon ending the numeric value. Accepts the current token value and returns a
             thunk that lazily parses the token.
@@ -746,29 +904,28 @@ def _coefficient_handler_factory(trans_table, parse_func, assertion=lambda c, ct
     def transition(prev, c, ctx, trans):
         if prev == _UNDERSCORE:
             _illegal_character(c, ctx, 'Underscore before %s.' % (chr(c),))
-        return ctx.immediate_transition(trans_table[c](c, ctx))
+        handler = trans_table[c] if c < _TABLE_SIZE else _illegal_character
+        return ctx.immediate_transition(handler(c, ctx))
     return _numeric_handler_factory(_DIGITS, transition, assertion, (_DOT,), parse_func,
                                     ion_type=ion_type, append_first_if_not=append_first_if_not)
 
 
-_FRACTIONAL_NUMBER_TABLE = _defaultdict(
-    _merge_mappings(
-        (_DECIMAL_EXPS, _decimal_handler),
-        (_FLOAT_EXPS, _float_handler)
-    )
+_FRACTIONAL_NUMBER_MAPPINGS = _merge_mappings(
+    (_DECIMAL_EXPS, _decimal_handler),
+    (_FLOAT_EXPS, _float_handler)
 )
+_FRACTIONAL_NUMBER_TABLE = _flatten(_FRACTIONAL_NUMBER_MAPPINGS)
 
 fractional_number_handler = _coefficient_handler_factory(
     _FRACTIONAL_NUMBER_TABLE, _parse_decimal, assertion=lambda c, ctx: c == _DOT, ion_type=IonType.DECIMAL)
 
-_WHOLE_NUMBER_TABLE = _defaultdict(
-    _merge_mappings(
-        {
-            _DOT: fractional_number_handler,
-        },
-        _FRACTIONAL_NUMBER_TABLE
-    )
+_WHOLE_NUMBER_MAPPINGS = _merge_mappings(
+    {
+        _DOT: fractional_number_handler,
+    },
+    _FRACTIONAL_NUMBER_MAPPINGS
 )
+_WHOLE_NUMBER_TABLE = _flatten(_WHOLE_NUMBER_MAPPINGS)
 
 _whole_number_handler = _coefficient_handler_factory(_WHOLE_NUMBER_TABLE, _parse_decimal_int,
                                                      append_first_if_not=_UNDERSCORE)
@@ -811,7 +968,7 @@ def _timestamp_zero_start_handler(c, ctx):
     while True:
         if c in _TIMESTAMP_YEAR_DELIMITERS:
             trans = ctx.immediate_transition(_timestamp_handler(c, ctx))
-        elif c in _DIGITS:
+        elif _CHAR_CLASSES.get(c, 0) & _CHAR_DIGIT:
             val.append(c)
         else:
             _illegal_character(c, ctx)
@@ -927,6 +1084,21 @@ def _parse_timestamp(tokens):
     return parse
 
 
+# Indexed by _TimestampState. Each entry holds the characters that may follow the second (or later) digit of that
+# state's component and whether the timestamp may legally end there.
+_TIMESTAMP_DIGIT_TRANSITIONS = (
+    None,  # YEAR is completed before _timestamp_handler is entered.
+    (_TIMESTAMP_YEAR_DELIMITERS, False),  # MONTH
+    ((_T,) + _VALUE_TERMINATORS, True),  # DAY
+    ((_COLON,), False),  # HOUR
+    (_TIMESTAMP_OFFSET_INDICATORS + (_COLON,), False),  # MINUTE
+    (_TIMESTAMP_OFFSET_INDICATORS + (_DOT,), False),  # SECOND
+    (_DIGITS + _TIMESTAMP_OFFSET_INDICATORS, False),  # FRACTIONAL
+    ((_COLON,), False),  # OFF_HOUR
+    (_VALUE_TERMINATORS, True),  # OFF_MINUTE
+)
+
+
 @coroutine
 def _timestamp_handler(c, ctx):
     """Handles timestamp values. Entered after the year component has been completed; tokenizes the remaining
@@ -937,8 +1109,6 @@ def _timestamp_handler(c, ctx):
     if len(ctx.value) != 4:
         _illegal_character(c, ctx, 'Timestamp year is %d digits; expected 4.' % (len(ctx.value),))
     prev = c
-    c, self = yield
-    trans = ctx.immediate_transition(self)
     state = _TimestampState.YEAR
     nxt = _DIGITS
     tokens = _TimestampTokens(ctx.value)
@@ -947,11 +1117,27 @@ def _timestamp_handler(c, ctx):
     if prev == _T:
         nxt += _VALUE_TERMINATORS
         can_terminate = True
+    else:
+        queue = ctx.queue
+        month_day = queue.read_match(_TIMESTAMP_MONTH_DAY_TEXT if queue.is_unicode else _TIMESTAMP_MONTH_DAY_BYTES)
+        if month_day:
+            # The month and day are already buffered, so they are taken in one step. Tokenizing resumes as if the
+            # day's second digit had just been read.
+            if queue.is_unicode:
+                month_day = month_day.encode('ascii')
+            tokens.transition(_TimestampState.MONTH).extend(month_day[:2])
+            state = _TimestampState.DAY
+            val = tokens.transition(state)
+            val.extend(month_day[3:])
+            prev = month_day[-1]
+            nxt, can_terminate = _TIMESTAMP_DIGIT_TRANSITIONS[state]
+    c, self = yield
+    trans = ctx.immediate_transition(self)
     while True:
         is_eof = can_terminate and BufferQueue.is_eof(c)
         if c not in nxt and not is_eof:
             _illegal_character(c, ctx, 'Expected %r in state %r.' % ([chr(x) for x in nxt], state))
-        if c in _VALUE_TERMINATORS or is_eof:
+        if _CHAR_CLASSES.get(c, 0) & _CHAR_TERMINATOR or is_eof:
             if not can_terminate:
                 _illegal_character(c, ctx, 'Unexpected termination of timestamp.')
             trans = ctx.event_transition(IonThunkEvent, IonEventType.SCALAR, ctx.ion_type, _parse_timestamp(tokens))
@@ -970,7 +1156,7 @@ def _timestamp_handler(c, ctx):
                 can_terminate = True
             elif c in _TIMESTAMP_DELIMITERS:
                 nxt = _DIGITS
-            elif c in _DIGITS:
+            elif _CHAR_CLASSES.get(c, 0) & _CHAR_DIGIT:
                 if prev == _PLUS or (state > _TimestampState.MONTH and prev == _HYPHEN):
                     state = _TimestampState.OFF_HOUR
                     val = tokens.transition(state)
@@ -981,27 +1167,11 @@ def _timestamp_handler(c, ctx):
                     val = tokens.transition(state)
                     if state == _TimestampState.FRACTIONAL:
                         nxt = _DIGITS + _TIMESTAMP_OFFSET_INDICATORS
-                elif prev in _DIGITS:
-                    if state == _TimestampState.MONTH:
-                        nxt = _TIMESTAMP_YEAR_DELIMITERS
-                    elif state == _TimestampState.DAY:
-                        nxt = (_T,) + _VALUE_TERMINATORS
-                        can_terminate = True
-                    elif state == _TimestampState.HOUR:
-                        nxt = (_COLON,)
-                    elif state == _TimestampState.MINUTE:
-                        nxt = _TIMESTAMP_OFFSET_INDICATORS + (_COLON,)
-                    elif state == _TimestampState.SECOND:
-                        nxt = _TIMESTAMP_OFFSET_INDICATORS + (_DOT,)
-                    elif state == _TimestampState.FRACTIONAL:
-                        nxt = _DIGITS + _TIMESTAMP_OFFSET_INDICATORS
-                    elif state == _TimestampState.OFF_HOUR:
-                        nxt = (_COLON,)
-                    elif state == _TimestampState.OFF_MINUTE:
-                        nxt = _VALUE_TERMINATORS
-                        can_terminate = True
-                    else:
+                elif _CHAR_CLASSES.get(prev, 0) & _CHAR_DIGIT:
+                    transition = _TIMESTAMP_DIGIT_TRANSITIONS[state]
+                    if transition is None:
                         raise ValueError('Unknown timestamp state %r.' % (state,))
+                    nxt, can_terminate = transition
                 else:
                     # Reaching this branch would be indicative of a programming error within this state machine.
                     raise ValueError('Digit following %s in timestamp state %r.' % (chr(prev), state))
@@ -1027,16 +1197,22 @@ def _comment_handler(c, ctx, whence):
         _illegal_character(c, ctx, 'Illegal character sequence "/%s".' % (chr(c),))
     done = False
     prev = None
+    queue = ctx.queue
     trans = ctx.immediate_transition(self)
     while not done:
         c, _ = yield trans
         if block_comment:
             if prev == _ASTERISK and c == _SLASH:
                 done = True
+            elif c != _ASTERISK:
+                # Nothing before the next asterisk can end the comment.
+                queue.skip_until(_BLOCK_COMMENT_SCAN_TARGETS)
             prev = c
         else:
             if c in _NEWLINES or BufferQueue.is_eof(c):
                 done = True
+            else:
+                queue.skip_until(_NEWLINES)
     yield ctx.set_self_delimiting(True).immediate_transition(whence)
 
 
@@ -1056,7 +1232,7 @@ def _sexp_slash_handler(c, ctx, whence=None, pending_event=None):
         if pending_event is not None:
             # Since this is the start of a new value and not a comment, the pending event must be emitted.
             assert pending_event.event is not None
-            yield _CompositeTransition(pending_event, ctx, partial(_operator_symbol_handler, _SLASH))
+            yield _CompositeTransition(pending_event, ctx, _slash_operator_symbol_handler)
         yield ctx.immediate_transition(_operator_symbol_handler(_SLASH, ctx))
 
 
@@ -1068,22 +1244,37 @@ _SINGLE_QUOTES = [
 
 
 def _validate_quoted_text(allowed_whitespace, c, ctx, max_char):
-    if c not in allowed_whitespace and not _is_escaped(c) and \
-            (c < _MIN_QUOTED_CHAR or c > max_char):
+    if (c < _MIN_QUOTED_CHAR or c > max_char) and c not in allowed_whitespace and not _is_escaped(c):
         _illegal_character(c, ctx, 'Character out of range [%d, %d] for this type.'
                            % (_MIN_QUOTED_CHAR, max_char,))
 
 _validate_long_string_text = partial(_validate_quoted_text, _WHITESPACE)
 
 
+def _plain_quoted_text_patterns(delimiter, max_char, allowed_whitespace):
+    """Compiles bytes and unicode patterns that match runs of characters that may be copied directly into the value of
+    a quoted text token with the given delimiter, maximum code point, and allowed whitespace, i.e. those that need
+    neither escape processing, newline normalization, nor validation.
+    """
+    legal = allowed_whitespace + tuple(range(_MIN_QUOTED_CHAR, min(max_char, 0xff) + 1))
+    byte_chars = ''.join(re.escape(chr(o)) for o in legal
+                         if o != delimiter and o != _BACKSLASH and o != _CARRIAGE_RETURN)
+    unicode_chars = byte_chars
+    if max_char > 0xff:
+        # Surrogates are left to the code point handler, which pairs or rejects them.
+        unicode_chars += u'\u0100-\ud7ff\ue000-%s' % (chr(max_char),)
+    return re.compile((u'[%s]+' % (byte_chars,)).encode('latin-1')), re.compile(u'[%s]+' % (unicode_chars,))
+
+
+# Indexed by whether the token is a clob, then by whether the input is unicode.
+_LONG_STRING_PLAIN_TEXT = (
+    _plain_quoted_text_patterns(_SINGLE_QUOTE, _MAX_TEXT_CHAR, _WHITESPACE),
+    _plain_quoted_text_patterns(_SINGLE_QUOTE, _MAX_CLOB_CHAR, _WHITESPACE),
+)
+
+
 def _is_escaped_newline(c):
-    if not (c in _NEWLINES and _is_escaped(c)):
-        return False
-    try:
-        return c.char == _ESCAPED_NEWLINE
-    except AttributeError:
-        return False
-    #return c in _NEWLINES and _is_escaped(c) and chr(c) == u''
+    return c in _NEWLINES and _is_escaped(c) and getattr(c, 'char', None) == _ESCAPED_NEWLINE
 
 
 @coroutine
@@ -1102,8 +1293,11 @@ def _long_string_handler(c, ctx, is_field_name=False):
         assert not val
         ctx.set_pending_symbol()
         val = ctx.pending_symbol
+    queue = ctx.queue
+    plain_text = _LONG_STRING_PLAIN_TEXT[is_clob][queue.is_unicode]
     quotes = 0
     in_data = True
+    val.extend(queue.read_match(plain_text))
     c, self = yield
     here = ctx.immediate_transition(self)
     trans = here
@@ -1121,6 +1315,7 @@ def _long_string_handler(c, ctx, is_field_name=False):
                 val.extend(_SINGLE_QUOTES[quotes])
                 if not _is_escaped_newline(c):
                     val.append(c)
+                val.extend(queue.read_match(plain_text))
                 quotes = 0
             else:
                 if quotes > 0:
@@ -1140,15 +1335,15 @@ def _long_string_handler(c, ctx, is_field_name=False):
                             # c was read as a single byte. Re-read it as a code point.
                             ctx.queue.unread(c)
                             ctx.set_quoted_text(True)
-                            c, _ = yield ctx.immediate_transition(self)
+                            c, _ = yield here
                             trans = _CompositeTransition(
                                 trans,
                                 ctx,
-                                partial(_quoted_symbol_handler, c, is_field_name=False),
+                                partial(_quoted_symbol_handler, c),
                             )
                         else:  # quotes == 2
                             trans = _CompositeTransition(trans, ctx, None, ctx.set_empty_symbol())
-                elif c not in _WHITESPACE:
+                elif not _CHAR_CLASSES.get(c, 0) & _CHAR_WHITESPACE:
                     if is_clob:
                         trans = ctx.immediate_transition(_clob_end_handler(c, ctx))
                     elif c == _SLASH:
@@ -1181,7 +1376,7 @@ def _typed_null_handler(c, ctx):
     trans = ctx.immediate_transition(self)
     while True:
         if done:
-            if _ends_value(c) or (ctx.container.ion_type is IonType.SEXP and c in _OPERATORS):
+            if _ends_value(c) or (ctx.container.ion_type is IonType.SEXP and _CHAR_CLASSES.get(c, 0) & _CHAR_OPERATOR):
                 trans = ctx.event_transition(IonEvent, IonEventType.SCALAR, nxt.ion_type, None)
             else:
                 _illegal_character(c, ctx, 'Illegal null type.')
@@ -1206,8 +1401,8 @@ def _symbol_or_keyword_handler(c, ctx, is_field_name=False):
     This may be an operator (if in an s-expression), an identifier symbol, or a keyword.
     """
     in_sexp = ctx.container.ion_type is IonType.SEXP
-    if c not in _IDENTIFIER_STARTS:
-        if in_sexp and c in _OPERATORS:
+    if not _CHAR_CLASSES.get(c, 0) & _CHAR_IDENTIFIER_START:
+        if in_sexp and _CHAR_CLASSES.get(c, 0) & _CHAR_OPERATOR:
             c_next, _ = yield
             ctx.queue.unread(c_next)
             yield ctx.immediate_transition(_operator_symbol_handler(c, ctx))
@@ -1220,43 +1415,65 @@ def _symbol_or_keyword_handler(c, ctx, is_field_name=False):
     maybe_nan = maybe_null
     maybe_true = c == _T_LOWER
     maybe_false = c == _F_LOWER
+    match_index = 0
+    if maybe_null or maybe_true or maybe_false:
+        queue = ctx.queue
+        suffix = queue.read_match((_KEYWORD_SUFFIX_TEXT if queue.is_unicode else _KEYWORD_SUFFIX_BYTES)[c])
+        if suffix:
+            val.extend(suffix)
+            match_index = len(suffix)
+            # Only one of 'null' and 'nan' can have matched.
+            maybe_nan = maybe_nan and match_index == len(_NAN_SUFFIX)
+            maybe_null = maybe_null and not maybe_nan
     c, self = yield
+    if match_index and not is_field_name and c != _DOT \
+            and _CHAR_CLASSES.get(c, 0) & (_CHAR_TERMINATOR | (in_sexp and _CHAR_OPERATOR)):
+        # The common case of a whole keyword followed by a character that ends it is resolved without the
+        # character-by-character checks below. A dot may instead begin a typed null.
+        keyword = _KEYWORD_VALUES.get(val.as_text())
+        if keyword is not None:
+            yield ctx.event_transition(IonEvent, IonEventType.SCALAR, *keyword)
     trans = ctx.immediate_transition(self)
     keyword_trans = None
-    match_index = 0
-    while True:
-        def check_keyword(name, keyword_sequence, ion_type, value, match_transition=lambda: None):
-            maybe_keyword = True
-            transition = None
-            if match_index < len(keyword_sequence):
-                maybe_keyword = c == keyword_sequence[match_index]
+    val_append = val.append
+
+    # These close over ``c`` and ``match_index``, so they observe the current character and position on each call
+    # without being redefined for every character.
+    def check_keyword(name, keyword_sequence, ion_type, value, match_transition=lambda: None):
+        maybe_keyword = True
+        transition = None
+        if match_index < len(keyword_sequence):
+            maybe_keyword = c == keyword_sequence[match_index]
+        else:
+            transition = match_transition()
+            if transition is not None:
+                pass
+            elif _ends_value(c):
+                if is_field_name:
+                    _illegal_character(c, ctx, '%s keyword as field name not allowed.' % (name,))
+                transition = ctx.event_transition(IonEvent, IonEventType.SCALAR, ion_type, value)
+            elif c == _COLON:
+                message = ''
+                if is_field_name:
+                    message = '%s keyword as field name not allowed.' % (name,)
+                _illegal_character(c, ctx, message)
+            elif in_sexp and _CHAR_CLASSES.get(c, 0) & _CHAR_OPERATOR:
+                transition = ctx.event_transition(IonEvent, IonEventType.SCALAR, ion_type, value)
             else:
-                transition = match_transition()
-                if transition is not None:
-                    pass
-                elif _ends_value(c):
-                    if is_field_name:
-                        _illegal_character(c, ctx, '%s keyword as field name not allowed.' % (name,))
-                    transition = ctx.event_transition(IonEvent, IonEventType.SCALAR, ion_type, value)
-                elif c == _COLON:
-                    message = ''
-                    if is_field_name:
-                        message = '%s keyword as field name not allowed.' % (name,)
-                    _illegal_character(c, ctx, message)
-                elif in_sexp and c in _OPERATORS:
-                    transition = ctx.event_transition(IonEvent, IonEventType.SCALAR, ion_type, value)
-                else:
-                    maybe_keyword = False
-            return maybe_keyword, transition
+                maybe_keyword = False
+        return maybe_keyword, transition
+
+    def check_null_dot():
+        transition = None
+        found = c == _DOT
+        if found:
+            if is_field_name:
+                _illegal_character(c, ctx, "Illegal character in field name.")
+            transition = ctx.immediate_transition(_typed_null_handler(c, ctx))
+        return transition
+
+    while True:
         if maybe_null:
-            def check_null_dot():
-                transition = None
-                found = c == _DOT
-                if found:
-                    if is_field_name:
-                        _illegal_character(c, ctx, "Illegal character in field name.")
-                    transition = ctx.immediate_transition(_typed_null_handler(c, ctx))
-                return transition
             maybe_null, keyword_trans = check_keyword('null', _NULL_SUFFIX.sequence,
                                                       IonType.NULL, None, check_null_dot)
         if maybe_nan:
@@ -1269,14 +1486,14 @@ def _symbol_or_keyword_handler(c, ctx, is_field_name=False):
             if keyword_trans is not None:
                 trans = keyword_trans
             else:
-                val.append(c)
+                val_append(c)
                 match_index += 1
         else:
-            if c in _SYMBOL_TOKEN_TERMINATORS:
+            if _CHAR_CLASSES.get(c, 0) & _CHAR_SYMBOL_TERMINATOR:
                 # This might be an annotation or a field name
                 ctx.set_pending_symbol(val)
                 trans = ctx.immediate_transition(ctx.whence)
-            elif _ends_value(c) or (in_sexp and c in _OPERATORS):
+            elif _ends_value(c) or (in_sexp and _CHAR_CLASSES.get(c, 0) & _CHAR_OPERATOR):
                 trans = ctx.event_transition(IonEvent, IonEventType.SCALAR, IonType.SYMBOL, val.as_symbol())
             else:
                 trans = ctx.immediate_transition(_unquoted_symbol_handler(c, ctx, is_field_name=is_field_name))
@@ -1314,7 +1531,8 @@ def _inf_or_operator_handler_factory(c_start, is_delegate=True):
                 if match_index < len(_INF_SUFFIX):
                     maybe_inf = c == _INF_SUFFIX[match_index]
                 else:
-                    if _ends_value(c) or (ctx.container.ion_type is IonType.SEXP and c in _OPERATORS):
+                    if _ends_value(c) or \
+                            (ctx.container.ion_type is IonType.SEXP and _CHAR_CLASSES.get(c, 0) & _CHAR_OPERATOR):
                         yield ctx.event_transition(
                             IonEvent, IonEventType.SCALAR, IonType.FLOAT, c_start == _MINUS and _NEG_INF or _POS_INF
                         )
@@ -1322,6 +1540,10 @@ def _inf_or_operator_handler_factory(c_start, is_delegate=True):
                         maybe_inf = False
             if maybe_inf:
                 match_index += 1
+                if match_index == 1:
+                    queue = ctx.queue
+                    match_index += len(queue.read_match(
+                        (_KEYWORD_SUFFIX_TEXT if queue.is_unicode else _KEYWORD_SUFFIX_BYTES)[c]))
             else:
                 ctx.set_unicode()
                 if match_index > 0:
@@ -1334,7 +1556,7 @@ def _inf_or_operator_handler_factory(c_start, is_delegate=True):
             _illegal_character(c, next_ctx is None and ctx or next_ctx,
                                'Illegal character following %s.' % (chr(c_start),))
         if match_index == 0:
-            if c in _OPERATORS:
+            if _CHAR_CLASSES.get(c, 0) & _CHAR_OPERATOR:
                 yield ctx.immediate_transition(_operator_symbol_handler(c, ctx))
             yield ctx.event_transition(IonEvent, IonEventType.SCALAR, IonType.SYMBOL, ctx.value.as_symbol())
         yield _CompositeTransition(
@@ -1353,23 +1575,31 @@ _positive_inf_or_sexp_plus_handler = _inf_or_operator_handler_factory(_PLUS, is_
 @coroutine
 def _operator_symbol_handler(c, ctx):
     """Handles operator symbol values within s-expressions."""
-    assert c in _OPERATORS
+    assert _CHAR_CLASSES.get(c, 0) & _CHAR_OPERATOR
     ctx.set_unicode()
+    queue = ctx.queue
+    operator_run = _OPERATOR_RUNS[queue.is_unicode]
     val = ctx.value
     val.append(c)
+    val.extend(queue.read_match(operator_run))
     c, self = yield
     trans = ctx.immediate_transition(self)
-    while c in _OPERATORS:
+    while _CHAR_CLASSES.get(c, 0) & _CHAR_OPERATOR:
         val.append(c)
+        val.extend(queue.read_match(operator_run))
         c, _ = yield trans
     yield ctx.event_transition(IonEvent, IonEventType.SCALAR, IonType.SYMBOL, val.as_symbol())
 
 
+# Pre-bound because a slash that does not start a comment within an s-expression always begins an operator symbol.
+_slash_operator_symbol_handler = partial(_operator_symbol_handler, _SLASH)
+
+
 def _symbol_token_end(c, ctx, is_field_name, value=None):
     """Returns a transition which ends the current symbol token."""
     if value is None:
         value = ctx.value
-    if is_field_name or c in _SYMBOL_TOKEN_TERMINATORS or ctx.quoted_text:
+    if is_field_name or _CHAR_CLASSES.get(c, 0) & _CHAR_SYMBOL_TERMINATOR or ctx.quoted_text:
         # This might be an annotation or a field name. Mark it as self-delimiting because a symbol token termination
         # character has been found.
         ctx.set_self_delimiting(ctx.quoted_text).set_pending_symbol(value).set_quoted_text(False)
@@ -1386,8 +1616,8 @@ def _unquoted_symbol_handler(c, ctx, is_field_name=False):
     """
     in_sexp = ctx.container.ion_type is IonType.SEXP
     ctx.set_unicode()
-    if c not in _IDENTIFIER_CHARACTERS:
-        if in_sexp and c in _OPERATORS:
+    if not _CHAR_CLASSES.get(c, 0) & _CHAR_IDENTIFIER:
+        if in_sexp and _CHAR_CLASSES.get(c, 0) & _CHAR_OPERATOR:
             c_next, _ = yield
             ctx.queue.unread(c_next)
             assert ctx.value
@@ -1397,18 +1627,25 @@ def _unquoted_symbol_handler(c, ctx, is_field_name=False):
                 partial(_operator_symbol_handler, c)
             )
         _illegal_character(c, ctx.set_ion_type(IonType.SYMBOL))
+    terminators = _CHAR_TERMINATOR | _CHAR_OPERATOR if in_sexp else _CHAR_TERMINATOR
+    queue = ctx.queue
+    identifier_run = _IDENTIFIER_RUN_TEXT if queue.is_unicode else _IDENTIFIER_RUN_BYTES
     val = ctx.value
+    val_extend = val.extend
     val.append(c)
+    val_extend(queue.read_match(identifier_run))
     prev = c
     c, self = yield
     trans = ctx.immediate_transition(self)
     while True:
-        if c not in _WHITESPACE:
-            if prev in _WHITESPACE or _ends_value(c) or c == _COLON or (in_sexp and c in _OPERATORS):
+        c_class = _CHAR_CLASSES.get(c, 0)
+        if not c_class & _CHAR_WHITESPACE:
+            if _CHAR_CLASSES.get(prev, 0) & _CHAR_WHITESPACE or c_class & terminators or c == _COLON:
                 break
-            if c not in _IDENTIFIER_CHARACTERS:
+            if not c_class & _CHAR_IDENTIFIER:
                 _illegal_character(c, ctx.set_ion_type(IonType.SYMBOL))
             val.append(c)
+            val_extend(queue.read_match(identifier_run))
         prev = c
         c, _ = yield trans
     yield _symbol_token_end(c, ctx, is_field_name)
@@ -1442,51 +1679,40 @@ def _symbol_identifier_or_unquoted_symbol_handler(c, ctx, is_field_name=False):
     assert c == _DOLLAR_SIGN
     in_sexp = ctx.container.ion_type is IonType.SEXP
     ctx.set_unicode().set_ion_type(IonType.SYMBOL)
+    queue = ctx.queue
+    identifier_run = _IDENTIFIER_RUN_TEXT if queue.is_unicode else _IDENTIFIER_RUN_BYTES
+    terminators = _CHAR_TERMINATOR | _CHAR_OPERATOR if in_sexp else _CHAR_TERMINATOR
     val = ctx.value
-    val.append(c)
+    val_append = val.append
+    val_append(c)
+    # An IVM or symbol identifier that is already buffered is consumed in one step, before the first character is
+    # requested from the container handler.
+    val.extend(queue.read_match(identifier_run))
     prev = c
     c, self = yield
     trans = ctx.immediate_transition(self)
-    maybe_ivm = ctx.depth == 0 and not is_field_name and not ctx.annotations
-    complete_ivm = False
-    maybe_symbol_identifier = True
-    match_index = 1
-    ivm_post_underscore = False
     while True:
-        if c not in _WHITESPACE:
-            if prev in _WHITESPACE or _ends_value(c) or c == _COLON or (in_sexp and c in _OPERATORS):
+        c_class = _CHAR_CLASSES.get(c, 0)
+        if not c_class & _CHAR_WHITESPACE:
+            if _CHAR_CLASSES.get(prev, 0) & _CHAR_WHITESPACE or c_class & terminators or c == _COLON:
                 break
-            maybe_symbol_identifier = maybe_symbol_identifier and c in _DIGITS
-            if maybe_ivm:
-                if match_index == len(_IVM_PREFIX):
-                    if c in _DIGITS:
-                        if ivm_post_underscore:
-                            complete_ivm = True
-                    elif c == _UNDERSCORE and not ivm_post_underscore:
-                        ivm_post_underscore = True
-                    else:
-                        maybe_ivm = False
-                        complete_ivm = False
-                else:
-                    maybe_ivm = c == _IVM_PREFIX[match_index]
-            if maybe_ivm:
-                if match_index < len(_IVM_PREFIX):
-                    match_index += 1
-            elif not maybe_symbol_identifier:
-                yield ctx.immediate_transition(_unquoted_symbol_handler(c, ctx, is_field_name))
-            val.append(c)
-        elif match_index < len(_IVM_PREFIX):
-            maybe_ivm = False
+            if not c_class & _CHAR_IDENTIFIER:
+                _illegal_character(c, ctx)
+            val_append(c)
+            # Consume the identifier characters that are already buffered without a round trip through the
+            # container handler for each one. The token is classified once it ends.
+            val.extend(queue.read_match(identifier_run))
         prev = c
         c, _ = yield trans
     if len(val) == 1:
         assert val[0] == chr(_DOLLAR_SIGN)
-    elif maybe_symbol_identifier:
-        assert not maybe_ivm
-        sid = int(val[1:])
-        val = SymbolToken(None, sid)
-    elif complete_ivm:
-        val = _IVMToken(*val.as_symbol())
+    else:
+        text = val.as_text()
+        if _SYMBOL_IDENTIFIER.fullmatch(text):
+            val = SymbolToken(None, int(text[1:]))
+        elif text.startswith(_IVM_PREFIX) and ctx.depth == 0 and not is_field_name and not ctx.annotations \
+                and _IVM_PATTERN.fullmatch(text):
+            val = _IVMToken(*val.as_symbol())
     yield _symbol_token_end(c, ctx, is_field_name, value=val)
 
 
@@ -1514,32 +1740,39 @@ def _quoted_text_handler_factory(delimiter, assertion, before, after, append_fir
             for yielding a different kind of Transition based on initialization parameters given to ``before`` (e.g.
             string vs. clob).
     """
+    # Indexed by whether the token is a clob, then by whether the input is unicode.
+    plain_text_patterns = (
+        _plain_quoted_text_patterns(delimiter, _MAX_TEXT_CHAR, _WHITESPACE_NOT_NL),
+        _plain_quoted_text_patterns(delimiter, _MAX_CLOB_CHAR, _WHITESPACE_NOT_NL),
+    )
+
     @coroutine
     def quoted_text_handler(c, ctx, is_field_name=False):
         assert assertion(c)
-
-        def append():
-            if not _is_escaped_newline(c):
-                val.append(c)
         is_clob = ctx.ion_type is IonType.CLOB
         max_char = _MAX_CLOB_CHAR if is_clob else _MAX_TEXT_CHAR
         ctx.set_unicode(quoted_text=True)
         val, event_on_close = before(c, ctx, is_field_name, is_clob)
-        if append_first:
-            append()
+        queue = ctx.queue
+        plain_text = plain_text_patterns[is_clob][queue.is_unicode]
+        val_append = val.append
+        if append_first and not _is_escaped_newline(c):
+            val_append(c)
+        val.extend(queue.read_match(plain_text))
         c, self = yield
         trans = ctx.immediate_transition(self)
-        done = False
-        while not done:
+        while True:
             if c == delimiter and not _is_escaped(c):
-                done = True
                 if event_on_close:
-                    trans = on_close(ctx)
-                else:
-                    break
-            else:
-                _validate_short_quoted_text(c, ctx, max_char)
-                append()
+                    c, _ = yield on_close(ctx)
+                break
+            _validate_short_quoted_text(c, ctx, max_char)
+            if not _is_escaped_newline(c):
+                val_append(c)
+            # Characters that need neither escape processing nor validation are copied straight from the buffered
+            # segment rather than being delivered one code point at a time. Only escapes, delimiters, and characters
+            # that require validation are left to the code point handler.
+            val.extend(queue.read_match(plain_text))
             c, _ = yield trans
         yield after(c, ctx, is_field_name)
     return quoted_text_handler
@@ -1602,15 +1835,15 @@ def _single_quote_handler_factory(on_single_quote, on_other):
         on_other (callable): Called when any character other than a single quote is found.  Accepts the current
             character's ordinal, the current context, and True if the token is a field name; returns a Transition.
     """
-    @coroutine
+    def step(c, ctx, is_field_name):
+        if c == _SINGLE_QUOTE and not _is_escaped(c):
+            return on_single_quote(c, ctx, is_field_name)
+        ctx.set_unicode(quoted_text=True)
+        return on_other(c, ctx, is_field_name)
+
     def single_quote_handler(c, ctx, is_field_name=False):
         assert c == _SINGLE_QUOTE
-        c, self = yield
-        if c == _SINGLE_QUOTE and not _is_escaped(c):
-            yield on_single_quote(c, ctx, is_field_name)
-        else:
-            ctx.set_unicode(quoted_text=True)
-            yield on_other(c, ctx, is_field_name)
+        return _SingleStepHandler(step, ctx, is_field_name)
     return single_quote_handler
 
 
@@ -1628,21 +1861,22 @@ _long_string_or_symbol_handler = _single_quote_handler_factory(
 )
 
 
-@coroutine
+def _struct_or_lob_step(c, ctx):
+    handler = _lob_start_handler if c == _OPEN_BRACE else _struct_handler
+    return ctx.immediate_transition(handler(c, ctx))
+
+
 def _struct_or_lob_handler(c, ctx):
     """Handles tokens that begin with an open brace."""
     assert c == _OPEN_BRACE
-    c, self = yield
-    yield ctx.immediate_transition(_STRUCT_OR_LOB_TABLE[c](c, ctx))
+    return _SingleStepHandler(_struct_or_lob_step, ctx)
 
 
 def _parse_lob(ion_type, value):
     def parse():
         if ion_type is IonType.CLOB:
-            byte_value = bytearray()
-            for b in value.as_text():
-                byte_value.append(ord(b))
-            return bytes(byte_value)
+            # Clob code points are limited to a single byte, so Latin-1 maps each one to the byte with the same value.
+            return value.as_text().encode('latin-1')
         return base64.b64decode(value)
     return parse
 
@@ -1655,7 +1889,7 @@ def _lob_start_handler(c, ctx):
     trans = ctx.immediate_transition(self)
     quotes = 0
     while True:
-        if c in _WHITESPACE:
+        if _CHAR_CLASSES.get(c, 0) & _CHAR_WHITESPACE:
             if quotes > 0:
                 _illegal_character(c, ctx)
         elif c == _DOUBLE_QUOTE:
@@ -1694,16 +1928,20 @@ def _lob_end_handler_factory(ion_type, action, validate=lambda c, ctx, action_re
     @coroutine
     def lob_end_handler(c, ctx):
         val = ctx.value
+        queue = ctx.queue
+        whitespace_run = _WHITESPACE_RUN_TEXT if queue.is_unicode else _WHITESPACE_RUN_BYTES
         prev = c
         action_res = None
-        if c != _CLOSE_BRACE and c not in _WHITESPACE:
+        if c != _CLOSE_BRACE and not _CHAR_CLASSES.get(c, 0) & _CHAR_WHITESPACE:
             action_res = action(c, ctx, prev, action_res, True)
         c, self = yield
         trans = ctx.immediate_transition(self)
         while True:
-            if c in _WHITESPACE:
+            if _CHAR_CLASSES.get(c, 0) & _CHAR_WHITESPACE:
                 if prev == _CLOSE_BRACE:
                     _illegal_character(c, ctx.set_ion_type(ion_type), 'Expected }.')
+                # Skip the rest of the buffered whitespace (e.g. the indentation of wrapped base-64 lines) in one step.
+                queue.read_match(whitespace_run)
             elif c == _CLOSE_BRACE:
                 if prev == _CLOSE_BRACE:
                     validate(c, ctx, action_res)
@@ -1719,31 +1957,23 @@ def _lob_end_handler_factory(ion_type, action, validate=lambda c, ctx, action_re
 
 def _blob_end_handler_factory():
     """Generates the handler for the end of a blob value. This includes the base-64 data and the two closing braces."""
-    def expand_res(res):
-        if res is None:
-            return 0, 0
-        return res
-
     def action(c, ctx, prev, res, is_first):
-        num_digits, num_pads = expand_res(res)
-        if c in _BASE64_DIGITS:
-            if prev == _CLOSE_BRACE or prev == _BASE64_PAD:
-                _illegal_character(c, ctx.set_ion_type(IonType.BLOB))
-            num_digits += 1
-        elif c == _BASE64_PAD:
-            if prev == _CLOSE_BRACE:
-                _illegal_character(c, ctx.set_ion_type(IonType.BLOB))
-            num_pads += 1
-        else:
+        if prev == _CLOSE_BRACE or not _CHAR_CLASSES.get(c, 0) & (_CHAR_BASE64 | _CHAR_BASE64_PAD):
             _illegal_character(c, ctx.set_ion_type(IonType.BLOB))
-        ctx.value.append(c)
-        return num_digits, num_pads
+        val = ctx.value
+        val.append(c)
+        # Take the rest of the run of base-64 characters already in the buffer in one step. Blob data is always
+        # accumulated as bytes, so runs from unicode input are converted.
+        queue = ctx.queue
+        if queue.is_unicode:
+            val.extend(queue.read_match(_BASE64_RUN_TEXT).encode('ascii'))
+        else:
+            val.extend(queue.read_match(_BASE64_RUN_BYTES))
 
     def validate(c, ctx, res):
-        num_digits, num_pads = expand_res(res)
-        if num_pads > 3 or (num_digits + num_pads) % 4 != 0:
-            _illegal_character(c, ctx, 'Incorrect number of pad characters (%d) for a blob of %d base-64 digits.'
-                               % (num_pads, num_digits))
+        # The placement and number of pad characters are checked once the data is complete, in a single pass.
+        if _BASE64_PATTERN.fullmatch(ctx.value) is None:
+            _illegal_character(c, ctx, 'Incorrect placement or number of pad characters in base-64 data.')
 
     return _lob_end_handler_factory(IonType.BLOB, action, validate)
 
@@ -1782,18 +2012,17 @@ def _container_start_handler_factory(ion_type, before_yield=lambda c, ctx: None)
     """
     assert ion_type.is_container
 
-    @coroutine
+    def step(c, ctx):
+        return ctx.event_transition(IonEvent, IonEventType.CONTAINER_START, ion_type, value=None)
+
     def container_start_handler(c, ctx):
         before_yield(c, ctx)
-        yield
-        yield ctx.event_transition(IonEvent, IonEventType.CONTAINER_START, ion_type, value=None)
+        return _SingleStepHandler(step, ctx)
     return container_start_handler
 
 
 # Struct requires unread_byte because we had to read one char past the { to make sure it wasn't a lob.
 _struct_handler = _container_start_handler_factory(IonType.STRUCT, lambda c, ctx: ctx.queue.unread(c))
-_list_handler = _container_start_handler_factory(IonType.LIST)
-_sexp_handler = _container_start_handler_factory(IonType.SEXP)
 
 
 @coroutine
@@ -1828,26 +2057,27 @@ def _read_data_handler(whence, ctx, complete, can_flush):
         trans = Transition(complete and ION_STREAM_END_EVENT or ION_STREAM_INCOMPLETE_EVENT, self)
 
 
-_ZERO_START_TABLE = _defaultdict(
+# The following tables are flattened; callers must handle ordinals greater than or equal to _TABLE_SIZE themselves.
+_ZERO_START_TABLE = _flatten(
     _merge_mappings(
-        _WHOLE_NUMBER_TABLE,
+        _WHOLE_NUMBER_MAPPINGS,
         (_DIGITS, _timestamp_zero_start_handler),
         (_BINARY_RADIX, _binary_int_handler),
         (_HEX_RADIX, _hex_int_handler)
     )
 )
 
-_NUMBER_OR_TIMESTAMP_TABLE = _defaultdict(
+_NUMBER_OR_TIMESTAMP_TABLE = _flatten(
     _merge_mappings(
         {
             _UNDERSCORE: _whole_number_handler,
         },
-        _WHOLE_NUMBER_TABLE,
+        _WHOLE_NUMBER_MAPPINGS,
         (_TIMESTAMP_YEAR_DELIMITERS, _timestamp_handler)
     )
 )
 
-_NEGATIVE_TABLE = _defaultdict(
+_NEGATIVE_TABLE = _flatten(
     _merge_mappings(
         {
             _ZERO: _number_zero_start_handler,
@@ -1857,12 +2087,10 @@ _NEGATIVE_TABLE = _defaultdict(
     fallback=_negative_inf_or_sexp_hyphen_handler
 )
 
-_STRUCT_OR_LOB_TABLE = _defaultdict({
-    _OPEN_BRACE: _lob_start_handler
-}, _struct_handler)
+_illegal_field_name_character = partial(_illegal_character, message='Illegal character in field name.')
 
-
-_FIELD_NAME_START_TABLE = _defaultdict(
+# The following tables are consulted at the start of every token.
+_FIELD_NAME_START_TABLE = _flatten(
     _merge_mappings(
         {
             _SINGLE_QUOTE: _single_quoted_field_name_handler,
@@ -1871,18 +2099,16 @@ _FIELD_NAME_START_TABLE = _defaultdict(
         },
         (_IDENTIFIER_STARTS, _unquoted_field_name_handler)
     ),
-    fallback=partial(_illegal_character, message='Illegal character in field name.')
+    fallback=_illegal_field_name_character
 )
 
-_VALUE_START_TABLE = _defaultdict(
+_VALUE_START_TABLE = _flatten(
     _merge_mappings(
         {
             _MINUS: _number_negative_start_handler,
             _PLUS: _positive_inf_or_sexp_plus_handler,
             _ZERO: _number_zero_start_handler,
             _OPEN_BRACE: _struct_or_lob_handler,
-            _OPEN_PAREN: _sexp_handler,
-            _OPEN_BRACKET: _list_handler,
             _SINGLE_QUOTE: _long_string_or_symbol_handler,
             _DOUBLE_QUOTE: _short_string_handler,
             _DOLLAR_SIGN: _symbol_identifier_or_unquoted_symbol_handler,
@@ -1892,25 +2118,50 @@ _VALUE_START_TABLE = _defaultdict(
     fallback=_symbol_or_keyword_handler
 )
 
-_IMMEDIATE_FLUSH_TABLE = _defaultdict(
+# Characters that unambiguously start a container. The container handler emits their start events directly, so they do
+# not appear in _VALUE_START_TABLE. _OPEN_BRACE might start a lob; that is handled by _struct_or_lob_handler.
+_CONTAINER_START_TABLE = _flatten({
+    _OPEN_BRACKET: IonType.LIST,
+    _OPEN_PAREN: IonType.SEXP,
+}, fallback=None)
+
+_IMMEDIATE_FLUSH_TABLE = _flatten(
     _merge_mappings(
         (_DIGITS, True),
-        (_LETTERS, True),
+        (_IDENTIFIER_STARTS, True),
         {_DOLLAR_SIGN: True},
     ),
-    fallback=lambda: False
+    fallback=False
 )
 
+# The three tables above, combined so that the start of each value requires a single lookup. Each entry is a
+# (container_type, start_handler, can_flush) tuple; ordinals outside the table use _UNTABLED_VALUE_DISPATCH.
+_VALUE_DISPATCH_TABLE = tuple(zip(_CONTAINER_START_TABLE, _VALUE_START_TABLE, _IMMEDIATE_FLUSH_TABLE))
+_UNTABLED_VALUE_DISPATCH = (None, _symbol_or_keyword_handler, False)
+
 
 @coroutine
 def _container_handler(c, ctx):
     """Coroutine for container values. Delegates to other coroutines to tokenize all child values."""
     _, self = (yield None)
     queue = ctx.queue
+    container = ctx.container
+    end = container.end
+    delimiter = container.delimiter
+    is_delimited = container.is_delimited
+    # Every character that ends a value in this container: its end and delimiter characters (if any), and EOF. These
+    # are tested together before the individual cases are distinguished.
+    boundaries = end + delimiter + (_EOF,)
+    read_byte = queue.read_byte
+    read_byte_after = queue.read_byte_after
+    whitespace_run = _WHITESPACE_RUN_TEXT if queue.is_unicode else _WHITESPACE_RUN_BYTES
+    is_struct = ctx.ion_type is IonType.STRUCT
+    in_sexp = ctx.ion_type is IonType.SEXP
+    is_top_level = ctx.depth == 0
     child_context = None
-    is_field_name = ctx.ion_type is IonType.STRUCT
+    is_field_name = is_struct
     delimiter_required = False
-    complete = ctx.depth == 0
+    complete = is_top_level
     can_flush = False
 
     def has_pending_symbol():
@@ -1923,7 +2174,7 @@ def _container_handler(c, ctx):
     def pending_symbol_value():
         if has_pending_symbol():
             assert not child_context.value
-            if ctx.ion_type is IonType.STRUCT and child_context.field_name is None:
+            if is_struct and child_context.field_name is None:
                 _illegal_character(c, ctx,
                                    'Encountered STRUCT value %s without field name.' % (child_context.pending_symbol,))
             return symbol_value_event()
@@ -1933,8 +2184,8 @@ def _container_handler(c, ctx):
         return child_context is not None and (child_context.annotations or child_context.field_name is not None)
 
     def _can_flush():
+        # Only called at the top level; values in nested containers can never be flushed, as the container must end.
         return child_context is not None and \
-               child_context.depth == 0 and \
                (
                    (
                        child_context.ion_type is not None and
@@ -1951,29 +2202,29 @@ def _container_handler(c, ctx):
 
     while True:
         # Loop over all values in this container.
-        if c in ctx.container.end or c in ctx.container.delimiter or BufferQueue.is_eof(c):
+        if c in boundaries:
             symbol_event = pending_symbol_value()
             if symbol_event is not None:
                 yield symbol_event
                 child_context = None
-                delimiter_required = ctx.container.is_delimited
-            if c in ctx.container.end:
+                delimiter_required = is_delimited
+            if c in end:
                 if not delimiter_required and is_value_decorated():
                     _illegal_character(c, child_context,
                                        'Dangling field name (%s) and/or annotation(s) (%r) at end of container.'
                                        % (child_context.field_name, child_context.annotations))
                 # Yield the close event and go to enclosing container. This coroutine instance will never resume.
                 yield Transition(
-                    IonEvent(IonEventType.CONTAINER_END, ctx.ion_type, depth=ctx.depth-1),
+                    _container_end_event(ctx.ion_type, ctx.depth - 1),
                     ctx.whence
                 )
                 raise ValueError('Resumed a finished container handler.')
-            elif c in ctx.container.delimiter:
+            elif c in delimiter:
                 if not delimiter_required:
                     _illegal_character(c, ctx.derive_child_context(None),
                                        'Encountered delimiter %s without preceding value.'
-                                       % (chr(ctx.container.delimiter[0]),))
-                is_field_name = ctx.ion_type is IonType.STRUCT
+                                       % (chr(delimiter[0]),))
+                is_field_name = is_struct
                 delimiter_required = False
                 c = None
             else:
@@ -1981,21 +2232,22 @@ def _container_handler(c, ctx):
                 assert len(queue) == 0
                 yield ctx.read_data_event(self, complete=True)
                 c = None
-        if c is not None and c not in _WHITESPACE:
+        if c is not None and not _CHAR_CLASSES.get(c, 0) & _CHAR_WHITESPACE:
             can_flush = False
+            container_type = None
             if c == _SLASH:
                 if child_context is None:
                     # This is the start of a new child value (or, if this is a comment, a new value will start after the
                     # comment ends).
                     child_context = ctx.derive_child_context(self)
-                if ctx.ion_type is IonType.SEXP:
+                if in_sexp:
                     handler = _sexp_slash_handler(c, child_context, pending_event=pending_symbol_value())
                 else:
                     handler = _comment_handler(c, child_context, self)
             elif delimiter_required:
                 # This is not the delimiter, or whitespace, or the start of a comment. Throw.
                 _illegal_character(c, ctx.derive_child_context(None), 'Delimiter %s not found after value.'
-                                   % (chr(ctx.container.delimiter[0]),))
+                                   % (chr(delimiter[0]),))
             elif has_pending_symbol():
                 # A character besides whitespace, comments, and delimiters has been found, and there is a pending
                 # symbol. That pending symbol is either an annotation, a field name, or a symbol value.
@@ -2006,9 +2258,9 @@ def _container_handler(c, ctx):
                         c = None
                     else:
                         assert not ctx.quoted_text
-                        if len(queue) == 0:
+                        if not queue:
                             yield ctx.read_data_event(self)
-                        c = queue.read_byte()
+                        c = read_byte()
                         if c == _COLON:
                             child_context.set_annotation()
                             c = None  # forces another character to be read safely
@@ -2022,35 +2274,43 @@ def _container_handler(c, ctx):
                     # It's a symbol value delimited by something other than a comma (i.e. whitespace or comment)
                     yield symbol_value_event()
                     child_context = None
-                    delimiter_required = ctx.container.is_delimited
+                    delimiter_required = is_delimited
                 continue
             else:
                 if not is_value_decorated():
                     # This is the start of a new child value.
                     child_context = ctx.derive_child_context(self)
+                in_table = c < _TABLE_SIZE
                 if is_field_name:
-                    handler = _FIELD_NAME_START_TABLE[c](c, child_context)
+                    start = _FIELD_NAME_START_TABLE[c] if in_table else _illegal_field_name_character
+                    handler = start(c, child_context)
                 else:
-                    handler = _VALUE_START_TABLE[c](c, child_context)  # Initialize the new handler
-                    can_flush = _IMMEDIATE_FLUSH_TABLE[c]
-            container_start = c == _OPEN_BRACKET or c == _OPEN_PAREN  # _OPEN_BRACE might start a lob; that is handled elsewhere.
+                    container_type, start, start_can_flush = \
+                        _VALUE_DISPATCH_TABLE[c] if in_table else _UNTABLED_VALUE_DISPATCH
+                    if container_type is None:
+                        handler = start(c, child_context)  # Initialize the new handler
+                        # Handlers may consume the buffered rest of their token before yielding, so the next read
+                        # can already be at the end of the data. Only top-level values may be ended by a flush.
+                        can_flush = start_can_flush and is_top_level
             quoted_start = c == _DOUBLE_QUOTE or c == _SINGLE_QUOTE
             while True:
                 # Loop over all characters in the current token. A token is either a non-symbol value or a pending
                 # symbol, which may end up being a field name, annotation, or symbol value.
-                if container_start:
+                if container_type is not None:
+                    # The container's start event needs no further input, so it is emitted without a handler.
                     c = None
-                    container_start = False
+                    trans = child_context.event_transition(IonEvent, IonEventType.CONTAINER_START, container_type, None)
+                    container_type = None
                 else:
                     if child_context.quoted_text or quoted_start:
                         quoted_start = False
                         yield child_context.next_code_point(self)
                         c = child_context.code_point
                     else:
-                        if len(queue) == 0:
+                        if not queue:
                             yield ctx.read_data_event(self, can_flush=can_flush)
-                        c = queue.read_byte()
-                trans = handler.send((c, handler))
+                        c = read_byte()
+                    trans = handler.send((c, handler))
                 if trans.event is not None:
                     is_self_delimiting = False
                     if child_context.is_composite:
@@ -2076,15 +2336,15 @@ def _container_handler(c, ctx):
                             None,
                             _container_handler(c, ctx.derive_container_context(trans.event.ion_type, self))
                         )
-                    complete = ctx.depth == 0
+                    complete = is_top_level
                     can_flush = False
                     if is_container or is_self_delimiting:
                         # The end of the value has been reached, and c needs to be updated
                         assert not ctx.quoted_text
-                        if len(queue) == 0:
+                        if not queue:
                             yield ctx.read_data_event(self, complete, can_flush)
-                        c = queue.read_byte()
-                    delimiter_required = ctx.container.is_delimited
+                        c = read_byte()
+                    delimiter_required = is_delimited
                     if next_transition is None:
                         break
                     else:
@@ -2092,61 +2352,85 @@ def _container_handler(c, ctx):
                 elif self is trans.delegate:
                     child_context.set_ion_type(None)  # The next token will determine the type.
                     complete = False
-                    can_flush = _can_flush()
+                    can_flush = is_top_level and _can_flush()
                     if is_field_name:
                         assert not can_flush
                         if c == _COLON or not child_context.is_self_delimiting:
                             break
                     elif has_pending_symbol():
-                        can_flush = ctx.depth == 0
+                        can_flush = is_top_level
                         if not child_context.is_self_delimiting or child_context.line_comment:
                             break
                     elif child_context.is_self_delimiting:
                         # This is the end of a comment. If this is at the top level and is un-annotated,
                         # it may end the stream.
-                        complete = ctx.depth == 0 and not is_value_decorated()
+                        complete = is_top_level and not is_value_decorated()
                     # This happens at the end of a comment within this container, or when a symbol token has been
                     # found. In both cases, an event should not be emitted. Read the next character and continue.
-                    if len(queue) == 0:
+                    if not queue:
                         yield ctx.read_data_event(self, complete, can_flush)
-                    c = queue.read_byte()
+                    c = read_byte()
                     break
                 # This is an immediate transition to a handler (may be the same one) for the current token.
-                can_flush = _can_flush()
+                can_flush = is_top_level and _can_flush()
                 handler = trans.delegate
         else:
             assert not ctx.quoted_text
-            if len(queue) == 0:
+            # Skip the rest of the buffered whitespace between values and read the character after it in one step.
+            c = read_byte_after(whitespace_run)
+            if c is None:
                 yield ctx.read_data_event(self, complete, can_flush)
-            c = queue.read_byte()
+                c = read_byte()
 
 
-@coroutine
-def _skip_trampoline(handler):
-    """Intercepts events from container handlers, emitting them only if they should not be skipped."""
-    data_event, self = (yield None)
-    delegate = handler
-    event = None
-    depth = 0
-    while True:
-        def pass_through():
-            _trans = delegate.send(Transition(data_event, delegate))
-            return _trans, _trans.delegate, _trans.event
+class _SkipTrampoline:
+    """Intercepts events from container handlers, emitting them only if they should not be skipped.
 
-        if data_event is not None and data_event.type is ReadEventType.SKIP:
+    This sits between the reader trampoline and the top-level container handler and is consulted for every event. It is
+    driven through ``send`` like the coroutines around it, but as a plain object it does not pay for a generator resume
+    on each call.
+    """
+    __slots__ = ('delegate', 'depth', 'skipping')
+
+    def __init__(self, handler):
+        self.delegate = handler
+        self.depth = 0
+        self.skipping = False
+
+    def send(self, transition):
+        data_event = transition.event
+        delegate = self.delegate
+        if self.skipping or (data_event is not None and data_event.type is ReadEventType.SKIP):
+            self.skipping = True
+            depth = self.depth
             while True:
-                trans, delegate, event = pass_through()
-                if event is not None:
-                    if event.event_type is IonEventType.CONTAINER_END and event.depth <= depth:
-                        break
-                if event is None or event.event_type is IonEventType.INCOMPLETE:
-                    data_event, _ = yield Transition(event, self)
+                trans = delegate.send(Transition(data_event, delegate))
+                delegate = trans.delegate
+                event = trans.event
+                if event is None:
+                    # Transitions without an event need no input, so the delegate is driven again directly rather
+                    # than through a round trip to the outer trampoline.
+                    data_event = None
+                    continue
+                if event.event_type is IonEventType.CONTAINER_END and event.depth <= depth:
+                    self.skipping = False
+                    break
+                if event.event_type is IonEventType.INCOMPLETE:
+                    self.delegate = delegate
+                    return Transition(event, self)
         else:
-            trans, delegate, event = pass_through()
-            if event is not None and (event.event_type is IonEventType.CONTAINER_START or
-                                      event.event_type is IonEventType.CONTAINER_END):
-                depth = event.depth
-        data_event, _ = yield Transition(event, self)
+            while True:
+                trans = delegate.send(Transition(data_event, delegate))
+                delegate = trans.delegate
+                event = trans.event
+                if event is not None:
+                    break
+                data_event = None
+            event_type = event.event_type
+            if event_type is IonEventType.CONTAINER_START or event_type is IonEventType.CONTAINER_END:
+                self.depth = event.depth
+        self.delegate = delegate
+        return Transition(event, self)
 
 
 _next_code_point_iter = partial(_next_code_point, yield_char=False)
@@ -2159,16 +2443,23 @@ def _next_code_point_handler(whence, ctx):
     queue = ctx.queue
     unicode_escapes_allowed = ctx.ion_type is not IonType.CLOB
     escaped_newline = False
-    escape_sequence = b''
+    escape_sequence = bytearray()
     low_surrogate_required = False
+    # The queue's iterator only ends when the queue is empty, which is checked before every read, so one iterator
+    # serves the whole handler.
+    queue_iter = iter(queue)
     while True:
         if len(queue) == 0:
             yield ctx.read_data_event(self)
-        queue_iter = iter(queue)
-        code_point_generator = _next_code_point_iter(queue, queue_iter)
-        code_point = next(code_point_generator)
+        code_point = next(queue_iter)
+        if _SURROGATE_START <= code_point <= _SURROGATE_END:
+            # Surrogate code units (only possible in unicode input) are paired by the code point iterator. Any other
+            # code unit is a complete code point.
+            queue.unread(code_point)
+            code_point_generator = _next_code_point_iter(queue, queue_iter)
+            code_point = next(code_point_generator)
         if code_point == _BACKSLASH:
-            escape_sequence += bytes((_BACKSLASH,))
+            escape_sequence.append(_BACKSLASH)
             num_digits = None
             while True:
                 if len(queue) == 0:
@@ -2181,15 +2472,15 @@ def _next_code_point_handler(whence, ctx):
                         low_surrogate_required = False
                     elif low_surrogate_required:
                         _illegal_character(code_point, ctx,
-                                           'Unpaired high surrogate escape sequence %s.' % (escape_sequence,))
+                                           'Unpaired high surrogate escape sequence %s.' % (bytes(escape_sequence),))
                     elif code_point == ord(b'x'):
                         num_digits = 4  # 2-digit hex escapes
                     elif code_point == ord(b'U') and unicode_escapes_allowed:
                         num_digits = 10  # 8-digit unicode escapes
                     elif code_point in _COMMON_ESCAPES:
                         if code_point == _SLASH or code_point == _QUESTION_MARK:
-                            escape_sequence = b''  # Drop the \. Python does not recognize these as escapes.
-                        escape_sequence += bytes((code_point,))
+                            escape_sequence.clear()  # Drop the \. Python does not recognize these as escapes.
+                        escape_sequence.append(code_point)
                         break
                     elif code_point in _NEWLINES:
                         escaped_newline = True
@@ -2197,14 +2488,26 @@ def _next_code_point_handler(whence, ctx):
                     else:
                         # This is a backslash followed by an invalid escape character. This is illegal.
                         _illegal_character(code_point, ctx, 'Invalid escape sequence \\%s.' % (chr(code_point),))
-                    escape_sequence += bytes((code_point,))
+                    escape_sequence.append(code_point)
                 else:
-                    if code_point not in _HEX_DIGITS:
+                    if not _CHAR_CLASSES.get(code_point, 0) & _CHAR_HEX:
                         _illegal_character(code_point, ctx,
                                            'Non-hex character %s found in unicode escape.' % (chr(code_point),))
-                    escape_sequence += bytes((code_point,))
+                    escape_sequence.append(code_point)
                     if len(escape_sequence) == num_digits:
                         break
+            if num_digits is not None and num_digits != 12:
+                # A single hex escape (\x, \u, or \U) outside the surrogate range maps directly to its code point,
+                # without a round trip through the unicode-escape codec. Anything else (surrogates, out-of-range
+                # values) falls through to the codec below, which reports the error.
+                code_point = int(escape_sequence[2:], 16)
+                if code_point <= _MAX_TEXT_CHAR and not _SURROGATE_START <= code_point <= _SURROGATE_END:
+                    char = chr(code_point)
+                    code_point = CodePoint(code_point)
+                    code_point.char = char
+                    code_point.is_escaped = True
+                    ctx.set_code_point(code_point)
+                    yield Transition(None, whence)
             if not escaped_newline:
                 decoded_escape_sequence = escape_sequence.decode('unicode-escape')
                 cp_iter = _next_code_point_iter(decoded_escape_sequence, iter(decoded_escape_sequence), to_int=ord)
@@ -2219,7 +2522,8 @@ def _next_code_point_handler(whence, ctx):
                 ctx.set_code_point(code_point)
                 yield Transition(None, whence)
         elif low_surrogate_required:
-            _illegal_character(code_point, ctx, 'Unpaired high surrogate escape sequence %s.' % (escape_sequence,))
+            _illegal_character(code_point, ctx,
+                               'Unpaired high surrogate escape sequence %s.' % (bytes(escape_sequence),))
         if code_point == _CARRIAGE_RETURN:
             # Normalize all newlines (\r, \n, and \r\n) to \n .
             if len(queue) == 0:
@@ -2318,6 +2622,6 @@ def reader(queue=None, is_unicode=False):
         ion_type=None,  # Top level
         pending_symbol=None
     )
-    return reader_trampoline(_skip_trampoline(_container_handler(None, ctx)), allow_flush=True)
+    return reader_trampoline(_SkipTrampoline(_container_handler(None, ctx)), allow_flush=True)
 
 text_reader = reader
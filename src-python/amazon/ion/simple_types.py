@@ -32,12 +32,13 @@ from decimal import Decimal
 
 from amazon.ion.core import IonType, IonEvent, Timestamp, TIMESTAMP_FRACTIONAL_SECONDS_FIELD, TIMESTAMP_PRECISION_FIELD, \
     TimestampPrecision
-from amazon.ion.symbols import SymbolToken
+from amazon.ion.symbols import SymbolToken, SYMBOL_ZERO_TOKEN
 
 
 class IonPyNull(object):
     __name__ = 'IonPyNull'
     __qualname__ = 'IonPyNull'
+    __slots__ = ('ion_type', 'ion_annotations')
 
     def __init__(self, ion_type=IonType.NULL, value=None, annotations=()):
         self.ion_type = ion_type
@@ -47,11 +48,7 @@ class IonPyNull(object):
         return False
 
     def __copy__(self):
-        args, kwargs = self._to_constructor_args(self)
-        value = self.__class__(*args, **kwargs)
-        value.ion_type = self.ion_type
-        value.ion_annotations = self.ion_annotations
-        return value
+        return self.__class__(self.ion_type, None, self.ion_annotations)
 
     @staticmethod
     def _to_constructor_args(value):
@@ -59,13 +56,15 @@ class IonPyNull(object):
 
     @classmethod
     def from_event(cls, ion_event):
-        if ion_event.value is not None:
-            args, kwargs = cls._to_constructor_args(ion_event.value)
-        else:
-            args, kwargs = (None, None, ()), {}
+        if ion_event.value is None:
+            # The constructor takes the type and annotations, so nothing needs to be set afterwards.
+            return cls(ion_event.ion_type, None, ion_event.annotations)
+        args, kwargs = cls._to_constructor_args(ion_event.value)
         value = cls(*args, **kwargs)
         value.ion_type = ion_event.ion_type
-        value.ion_annotations = ion_event.annotations
+        annotations = ion_event.annotations
+        if annotations:
+            value.ion_annotations = annotations
         return value
 
     @classmethod
@@ -80,13 +79,13 @@ class IonPyNull(object):
         return value
 
     def to_event(self, event_type, field_name=None, in_struct=False, depth=None):
-        value = self
-        if isinstance(self, IonPyNull):
-            value = None
+        value = None
 
         if in_struct:
-            if not isinstance(field_name, SymbolToken):
-                field_name = SymbolToken(field_name, 0 if field_name is None else None)
+            if field_name is None:
+                field_name = SYMBOL_ZERO_TOKEN
+            elif not isinstance(field_name, SymbolToken):
+                field_name = SymbolToken(field_name, None)
         else:
             field_name = None
 
@@ -97,16 +96,16 @@ class IonPyNull(object):
 class IonPyDecimal(Decimal):
     __name__ = 'IonPyDecimal'
     __qualname__ = 'IonPyDecimal'
-    ion_type = IonType.DECIMAL
+    __slots__ = ('ion_type', 'ion_annotations')
 
     def __new__(cls, *args, **kwargs):
-        v = super().__new__(cls, *args, **kwargs)
+        v = Decimal.__new__(cls, *args, **kwargs)
+        v.ion_type = IonType.DECIMAL
         v.ion_annotations = ()
         return v
 
     def __copy__(self):
-        args, kwargs = self._to_constructor_args(self)
-        value = self.__class__(*args, **kwargs)
+        value = self.__class__(self)
         value.ion_type = self.ion_type
         value.ion_annotations = self.ion_annotations
         return value
@@ -117,13 +116,15 @@ class IonPyDecimal(Decimal):
 
     @classmethod
     def from_event(cls, ion_event):
-        if ion_event.value is not None:
-            args, kwargs = cls._to_constructor_args(ion_event.value)
+        event_value = ion_event.value
+        if event_value is not None:
+            value = cls(event_value)
         else:
-            args, kwargs = (None, None, ()), {}
-        value = cls(*args, **kwargs)
+            value = cls(None, None, ())
         value.ion_type = ion_event.ion_type
-        value.ion_annotations = ion_event.annotations
+        annotations = ion_event.annotations
+        if annotations:
+            value.ion_annotations = annotations
         return value
 
     @classmethod
@@ -131,20 +132,19 @@ class IonPyDecimal(Decimal):
         if value is None:
             value = IonPyNull()
         else:
-            args, kwargs = cls._to_constructor_args(value)
-            value = cls(*args, **kwargs)
+            value = cls(value)
         value.ion_type = ion_type
         value.ion_annotations = annotations
         return value
 
     def to_event(self, event_type, field_name=None, in_struct=False, depth=None):
         value = self
-        if isinstance(self, IonPyNull):
-            value = None
 
         if in_struct:
-            if not isinstance(field_name, SymbolToken):
-                field_name = SymbolToken(field_name, 0 if field_name is None else None)
+            if field_name is None:
+                field_name = SYMBOL_ZERO_TOKEN
+            elif not isinstance(field_name, SymbolToken):
+                field_name = SymbolToken(field_name, None)
         else:
             field_name = None
 
@@ -157,13 +157,12 @@ class IonPyBytes(bytes):
     __qualname__ = 'IonPyBytes'
 
     def __new__(cls, *args, **kwargs):
-        v = super().__new__(cls, *args, **kwargs)
+        v = bytes.__new__(cls, *args, **kwargs)
         v.ion_annotations = ()
         return v
 
     def __copy__(self):
-        args, kwargs = self._to_constructor_args(self)
-        value = self.__class__(*args, **kwargs)
+        value = self.__class__(self)
         value.ion_type = self.ion_type
         value.ion_annotations = self.ion_annotations
         return value
@@ -174,13 +173,15 @@ class IonPyBytes(bytes):
 
     @classmethod
     def from_event(cls, ion_event):
-        if ion_event.value is not None:
-            args, kwargs = cls._to_constructor_args(ion_event.value)
+        event_value = ion_event.value
+        if event_value is not None:
+            value = cls(event_value)
         else:
-            args, kwargs = (None, None, ()), {}
-        value = cls(*args, **kwargs)
+            value = cls(None, None, ())
         value.ion_type = ion_event.ion_type
-        value.ion_annotations = ion_event.annotations
+        annotations = ion_event.annotations
+        if annotations:
+            value.ion_annotations = annotations
         return value
 
     @classmethod
@@ -188,20 +189,19 @@ class IonPyBytes(bytes):
         if value is None:
             value = IonPyNull()
         else:
-            args, kwargs = cls._to_constructor_args(value)
-            value = cls(*args, **kwargs)
+            value = cls(value)
         value.ion_type = ion_type
         value.ion_annotations = annotations
         return value
 
     def to_event(self, event_type, field_name=None, in_struct=False, depth=None):
         value = self
-        if isinstance(self, IonPyNull):
-            value = None
 
         if in_struct:
-            if not isinstance(field_name, SymbolToken):
-                field_name = SymbolToken(field_name, 0 if field_name is None else None)
+            if field_name is None:
+                field_name = SYMBOL_ZERO_TOKEN
+            elif not isinstance(field_name, SymbolToken):
+                field_name = SymbolToken(field_name, None)
         else:
             field_name = None
 
@@ -215,13 +215,12 @@ class IonPyInt(int):
     ion_type = IonType.INT
 
     def __new__(cls, *args, **kwargs):
-        v = super().__new__(cls, *args, **kwargs)
+        v = int.__new__(cls, *args, **kwargs)
         v.ion_annotations = ()
         return v
 
     def __copy__(self):
-        args, kwargs = self._to_constructor_args(self)
-        value = self.__class__(*args, **kwargs)
+        value = self.__class__(self)
         value.ion_type = self.ion_type
         value.ion_annotations = self.ion_annotations
         return value
@@ -232,13 +231,15 @@ class IonPyInt(int):
 
     @classmethod
     def from_event(cls, ion_event):
-        if ion_event.value is not None:
-            args, kwargs = cls._to_constructor_args(ion_event.value)
+        event_value = ion_event.value
+        if event_value is not None:
+            value = cls(event_value)
         else:
-            args, kwargs = (None, None, ()), {}
-        value = cls(*args, **kwargs)
+            value = cls(None, None, ())
         value.ion_type = ion_event.ion_type
-        value.ion_annotations = ion_event.annotations
+        annotations = ion_event.annotations
+        if annotations:
+            value.ion_annotations = annotations
         return value
 
     @classmethod
@@ -246,20 +247,19 @@ class IonPyInt(int):
         if value is None:
             value = IonPyNull()
         else:
-            args, kwargs = cls._to_constructor_args(value)
-            value = cls(*args, **kwargs)
+            value = cls(value)
         value.ion_type = ion_type
         value.ion_annotations = annotations
         return value
 
     def to_event(self, event_type, field_name=None, in_struct=False, depth=None):
         value = self
-        if isinstance(self, IonPyNull):
-            value = None
 
         if in_struct:
-            if not isinstance(field_name, SymbolToken):
-                field_name = SymbolToken(field_name, 0 if field_name is None else None)
+            if field_name is None:
+                field_name = SYMBOL_ZERO_TOKEN
+            elif not isinstance(field_name, SymbolToken):
+                field_name = SymbolToken(field_name, None)
         else:
             field_name = None
 
@@ -276,13 +276,12 @@ class IonPyBool(int):
         return str(bool(self))
 
     def __new__(cls, *args, **kwargs):
-        v = super().__new__(cls, *args, **kwargs)
+        v = int.__new__(cls, *args, **kwargs)
         v.ion_annotations = ()
         return v
 
     def __copy__(self):
-        args, kwargs = self._to_constructor_args(self)
-        value = self.__class__(*args, **kwargs)
+        value = self.__class__(self)
         value.ion_type = self.ion_type
         value.ion_annotations = self.ion_annotations
         return value
@@ -293,13 +292,15 @@ class IonPyBool(int):
 
     @classmethod
     def from_event(cls, ion_event):
-        if ion_event.value is not None:
-            args, kwargs = cls._to_constructor_args(ion_event.value)
+        event_value = ion_event.value
+        if event_value is not None:
+            value = cls(event_value)
         else:
-            args, kwargs = (None, None, ()), {}
-        value = cls(*args, **kwargs)
+            value = cls(None, None, ())
         value.ion_type = ion_event.ion_type
-        value.ion_annotations = ion_event.annotations
+        annotations = ion_event.annotations
+        if annotations:
+            value.ion_annotations = annotations
         return value
 
     @classmethod
@@ -307,20 +308,19 @@ class IonPyBool(int):
         if value is None:
             value = IonPyNull()
         else:
-            args, kwargs = cls._to_constructor_args(value)
-            value = cls(*args, **kwargs)
+            value = cls(value)
         value.ion_type = ion_type
         value.ion_annotations = annotations
         return value
 
     def to_event(self, event_type, field_name=None, in_struct=False, depth=None):
         value = self
-        if isinstance(self, IonPyNull):
-            value = None
 
         if in_struct:
-            if not isinstance(field_name, SymbolToken):
-                field_name = SymbolToken(field_name, 0 if field_name is None else None)
+            if field_name is None:
+                field_name = SYMBOL_ZERO_TOKEN
+            elif not isinstance(field_name, SymbolToken):
+                field_name = SymbolToken(field_name, None)
         else:
             field_name = None
 
@@ -331,16 +331,16 @@ class IonPyBool(int):
 class IonPyFloat(float):
     __name__ = 'IonPyFloat'
     __qualname__ = 'IonPyFloat'
-    ion_type = IonType.FLOAT
+    __slots__ = ('ion_type', 'ion_annotations')
 
     def __new__(cls, *args, **kwargs):
-        v = super().__new__(cls, *args, **kwargs)
+        v = float.__new__(cls, *args, **kwargs)
+        v.ion_type = IonType.FLOAT
         v.ion_annotations = ()
         return v
 
     def __copy__(self):
-        args, kwargs = self._to_constructor_args(self)
-        value = self.__class__(*args, **kwargs)
+        value = self.__class__(self)
         value.ion_type = self.ion_type
         value.ion_annotations = self.ion_annotations
         return value
@@ -351,13 +351,15 @@ class IonPyFloat(float):
 
     @classmethod
     def from_event(cls, ion_event):
-        if ion_event.value is not None:
-            args, kwargs = cls._to_constructor_args(ion_event.value)
+        event_value = ion_event.value
+        if event_value is not None:
+            value = cls(event_value)
         else:
-            args, kwargs = (None, None, ()), {}
-        value = cls(*args, **kwargs)
+            value = cls(None, None, ())
         value.ion_type = ion_event.ion_type
-        value.ion_annotations = ion_event.annotations
+        annotations = ion_event.annotations
+        if annotations:
+            value.ion_annotations = annotations
         return value
 
     @classmethod
@@ -365,20 +367,19 @@ class IonPyFloat(float):
         if value is None:
             value = IonPyNull()
         else:
-            args, kwargs = cls._to_constructor_args(value)
-            value = cls(*args, **kwargs)
+            value = cls(value)
         value.ion_type = ion_type
         value.ion_annotations = annotations
         return value
 
     def to_event(self, event_type, field_name=None, in_struct=False, depth=None):
         value = self
-        if isinstance(self, IonPyNull):
-            value = None
 
         if in_struct:
-            if not isinstance(field_name, SymbolToken):
-                field_name = SymbolToken(field_name, 0 if field_name is None else None)
+            if field_name is None:
+                field_name = SYMBOL_ZERO_TOKEN
+            elif not isinstance(field_name, SymbolToken):
+                field_name = SymbolToken(field_name, None)
         else:
             field_name = None
 
@@ -389,16 +390,16 @@ class IonPyFloat(float):
 class IonPyText(str):
     __name__ = 'IonPyText'
     __qualname__ = 'IonPyText'
-    ion_type = IonType.STRING
+    __slots__ = ('ion_type', 'ion_annotations')
 
     def __new__(cls, *args, **kwargs):
-        v = super().__new__(cls, *args, **kwargs)
+        v = str.__new__(cls, *args, **kwargs)
+        v.ion_type = IonType.STRING
         v.ion_annotations = ()
         return v
 
     def __copy__(self):
-        args, kwargs = self._to_constructor_args(self)
-        value = self.__class__(*args, **kwargs)
+        value = self.__class__(self)
         value.ion_type = self.ion_type
         value.ion_annotations = self.ion_annotations
         return value
@@ -409,13 +410,15 @@ class IonPyText(str):
 
     @classmethod
     def from_event(cls, ion_event):
-        if ion_event.value is not None:
-            args, kwargs = cls._to_constructor_args(ion_event.value)
+        event_value = ion_event.value
+        if event_value is not None:
+            value = cls(event_value)
         else:
-            args, kwargs = (None, None, ()), {}
-        value = cls(*args, **kwargs)
+            value = cls(None, None, ())
         value.ion_type = ion_event.ion_type
-        value.ion_annotations = ion_event.annotations
+        annotations = ion_event.annotations
+        if annotations:
+            value.ion_annotations = annotations
         return value
 
     @classmethod
@@ -423,20 +426,19 @@ class IonPyText(str):
         if value is None:
             value = IonPyNull()
         else:
-            args, kwargs = cls._to_constructor_args(value)
-            value = cls(*args, **kwargs)
+            value = cls(value)
         value.ion_type = ion_type
         value.ion_annotations = annotations
         return value
 
     def to_event(self, event_type, field_name=None, in_struct=False, depth=None):
         value = self
-        if isinstance(self, IonPyNull):
-            value = None
 
         if in_struct:
-            if not isinstance(field_name, SymbolToken):
-                field_name = SymbolToken(field_name, 0 if field_name is None else None)
+            if field_name is None:
+                field_name = SYMBOL_ZERO_TOKEN
+            elif not isinstance(field_name, SymbolToken):
+                field_name = SymbolToken(field_name, None)
         else:
             field_name = None
 
@@ -447,10 +449,11 @@ class IonPyText(str):
 class IonPyTimestamp(Timestamp):
     __name__ = 'IonPyTimestamp'
     __qualname__ = 'IonPyTimestamp'
-    ion_type = IonType.TIMESTAMP
+    __slots__ = ('ion_type', 'ion_annotations')
 
     def __new__(cls, *args, **kwargs):
-        v = super().__new__(cls, *args, **kwargs)
+        v = Timestamp.__new__(cls, *args, **kwargs)
+        v.ion_type = IonType.TIMESTAMP
         v.ion_annotations = ()
         return v
 
@@ -465,9 +468,8 @@ class IonPyTimestamp(Timestamp):
     def _to_constructor_args(ts):
         if isinstance(ts, Timestamp):
             args = (ts.year, ts.month, ts.day, ts.hour, ts.minute, ts.second, None, ts.tzinfo)
-            fractional_seconds = getattr(ts, TIMESTAMP_FRACTIONAL_SECONDS_FIELD, None)
-            precision = getattr(ts, TIMESTAMP_PRECISION_FIELD, TimestampPrecision.SECOND)
-            kwargs = {TIMESTAMP_PRECISION_FIELD: precision, TIMESTAMP_FRACTIONAL_SECONDS_FIELD: fractional_seconds}
+            # Timestamp.__new__ always sets its slotted fields, so they can be read directly.
+            kwargs = {TIMESTAMP_PRECISION_FIELD: ts.precision, TIMESTAMP_FRACTIONAL_SECONDS_FIELD: ts.fractional_seconds}
         else:
             args = (ts.year, ts.month, ts.day, ts.hour, ts.minute, ts.second, ts.microsecond, ts.tzinfo)
             kwargs = {TIMESTAMP_PRECISION_FIELD: TimestampPrecision.SECOND}
@@ -481,7 +483,9 @@ class IonPyTimestamp(Timestamp):
             args, kwargs = (None, None, ()), {}
         value = cls(*args, **kwargs)
         value.ion_type = ion_event.ion_type
-        value.ion_annotations = ion_event.annotations
+        annotations = ion_event.annotations
+        if annotations:
+            value.ion_annotations = annotations
         return value
 
     @classmethod
@@ -497,12 +501,12 @@ class IonPyTimestamp(Timestamp):
 
     def to_event(self, event_type, field_name=None, in_struct=False, depth=None):
         value = self
-        if isinstance(self, IonPyNull):
-            value = None
 
         if in_struct:
-            if not isinstance(field_name, SymbolToken):
-                field_name = SymbolToken(field_name, 0 if field_name is None else None)
+            if field_name is None:
+                field_name = SYMBOL_ZERO_TOKEN
+            elif not isinstance(field_name, SymbolToken):
+                field_name = SymbolToken(field_name, None)
         else:
             field_name = None
 
@@ -517,13 +521,12 @@ class IonPySymbol(SymbolToken):
 
     # a good signature: IonPySymbol(ion_type, symbol_token, annotation)
     def __new__(cls, *args, **kwargs):
-        v = super().__new__(cls, *args, **kwargs)
+        v = SymbolToken.__new__(cls, *args, **kwargs)
         v.ion_annotations = ()
         return v
 
     def __copy__(self):
-        args, kwargs = self._to_constructor_args(self)
-        value = self.__class__(*args, **kwargs)
+        value = self.__class__(self.text, self.sid, self.location)
         value.ion_type = self.ion_type
         value.ion_annotations = self.ion_annotations
         return value
@@ -539,19 +542,27 @@ class IonPySymbol(SymbolToken):
 
     @classmethod
     def from_event(cls, ion_event):
-        if ion_event.value is not None:
-            args, kwargs = cls._to_constructor_args(ion_event.value)
+        event_value = ion_event.value
+        if isinstance(event_value, SymbolToken):
+            # Readers always produce tokens, whose fields are the constructor arguments.
+            value = cls(*event_value)
+        elif event_value is not None:
+            args, kwargs = cls._to_constructor_args(event_value)
+            value = cls(*args, **kwargs)
         else:
-            args, kwargs = (None, None, ()), {}
-        value = cls(*args, **kwargs)
+            value = cls(None, None, ())
         value.ion_type = ion_event.ion_type
-        value.ion_annotations = ion_event.annotations
+        annotations = ion_event.annotations
+        if annotations:
+            value.ion_annotations = annotations
         return value
 
     @classmethod
     def from_value(cls, ion_type, value, annotations=()):
         if value is None:
             value = IonPyNull()
+        elif isinstance(value, SymbolToken):
+            value = cls(*value)
         else:
             args, kwargs = cls._to_constructor_args(value)
             value = cls(*args, **kwargs)
@@ -561,12 +572,12 @@ class IonPySymbol(SymbolToken):
 
     def to_event(self, event_type, field_name=None, in_struct=False, depth=None):
         value = self
-        if isinstance(self, IonPyNull):
-            value = None
 
         if in_struct:
-            if not isinstance(field_name, SymbolToken):
-                field_name = SymbolToken(field_name, 0 if field_name is None else None)
+            if field_name is None:
+                field_name = SYMBOL_ZERO_TOKEN
+            elif not isinstance(field_name, SymbolToken):
+                field_name = SymbolToken(field_name, None)
         else:
             field_name = None
 
@@ -577,14 +588,15 @@ class IonPySymbol(SymbolToken):
 class IonPyList(list):
     __name__ = 'IonPyList'
     __qualname__ = 'IonPyList'
+    __slots__ = ('ion_type', 'ion_annotations')
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self.ion_type = IonType.LIST
         self.ion_annotations = ()
 
     def __copy__(self):
-        args, kwargs = self._to_constructor_args(self)
-        value = self.__class__(*args, **kwargs)
+        value = self.__class__(self)
         value.ion_type = self.ion_type
         value.ion_annotations = self.ion_annotations
         return value
@@ -595,13 +607,15 @@ class IonPyList(list):
 
     @classmethod
     def from_event(cls, ion_event):
-        if ion_event.value is not None:
-            args, kwargs = cls._to_constructor_args(ion_event.value)
+        event_value = ion_event.value
+        if event_value is not None:
+            value = cls(event_value)
         else:
-            args, kwargs = (), {}
-        value = cls(*args, **kwargs)
+            value = cls()
         value.ion_type = ion_event.ion_type
-        value.ion_annotations = ion_event.annotations
+        annotations = ion_event.annotations
+        if annotations:
+            value.ion_annotations = annotations
         return value
 
     @classmethod
@@ -609,8 +623,7 @@ class IonPyList(list):
         if value is None:
             value = IonPyNull()
         else:
-            args, kwargs = cls._to_constructor_args(value)
-            value = cls(*args, **kwargs)
+            value = cls(value)
         value.ion_type = ion_type
         value.ion_annotations = annotations
         return value
@@ -619,8 +632,10 @@ class IonPyList(list):
         value = None
 
         if in_struct:
-            if not isinstance(field_name, SymbolToken):
-                field_name = SymbolToken(field_name, 0 if field_name is None else None)
+            if field_name is None:
+                field_name = SYMBOL_ZERO_TOKEN
+            elif not isinstance(field_name, SymbolToken):
+                field_name = SymbolToken(field_name, None)
         else:
             field_name = None
 
@@ -656,10 +671,11 @@ class IonPyStdDict(dict):
     """
     __name__ = 'IonPyStdDict'
     __qualname__ = 'IonPyStdDict'
-    ion_type = IonType.STRUCT
+    __slots__ = ('ion_type', 'ion_annotations')
 
     def __init__(self, annotations=()):
         super().__init__(self)
+        self.ion_type = IonType.STRUCT
         self.ion_annotations = annotations
 
 
@@ -676,10 +692,11 @@ class IonPyDict(MutableMapping):
     """
     __name__ = 'IonPyDict'
     __qualname__ = 'IonPyDict'
-    ion_type = IonType.STRUCT
+    __slots__ = ('ion_type', 'ion_annotations', '__store')
 
     def __init__(self, *args, **kwargs):
         super().__init__()
+        self.ion_type = IonType.STRUCT
         self.ion_annotations = ()
         self.__store = {}
         if args:
@@ -745,8 +762,7 @@ class IonPyDict(MutableMapping):
         return [i for i in self.iteritems()]
 
     def __copy__(self):
-        args, kwargs = self._to_constructor_args(self)
-        value = self.__class__(*args, **kwargs)
+        value = self.__class__(self)
         value.ion_type = self.ion_type
         value.ion_annotations = self.ion_annotations
         return value
@@ -757,13 +773,15 @@ class IonPyDict(MutableMapping):
 
     @classmethod
     def from_event(cls, ion_event):
-        if ion_event.value is not None:
-            args, kwargs = cls._to_constructor_args(ion_event.value)
+        event_value = ion_event.value
+        if event_value is not None:
+            value = cls(event_value)
         else:
-            args, kwargs = (), {}
-        value = cls(*args, **kwargs)
+            value = cls()
         value.ion_type = ion_event.ion_type
-        value.ion_annotations = ion_event.annotations
+        annotations = ion_event.annotations
+        if annotations:
+            value.ion_annotations = annotations
         return value
 
     @classmethod
@@ -771,8 +789,7 @@ class IonPyDict(MutableMapping):
         if value is None:
             value = IonPyNull()
         else:
-            args, kwargs = cls._to_constructor_args(value)
-            value = cls(*args, **kwargs)
+            value = cls(value)
         value.ion_type = ion_type
         value.ion_annotations = annotations
         return value
@@ -788,6 +805,7 @@ class IonPyDict(MutableMapping):
         ipd = IonPyDict.__new__(IonPyDict)
         MutableMapping.__init__(ipd)
         ipd.__store = store
+        ipd.ion_type = IonType.STRUCT
         ipd.ion_annotations = annotations
 
         return ipd
@@ -796,8 +814,10 @@ class IonPyDict(MutableMapping):
         value = None
 
         if in_struct:
-            if not isinstance(field_name, SymbolToken):
-                field_name = SymbolToken(field_name, 0 if field_name is None else None)
+            if field_name is None:
+                field_name = SYMBOL_ZERO_TOKEN
+            elif not isinstance(field_name, SymbolToken):
+                field_name = SymbolToken(field_name, None)
         else:
             field_name = None
 
@@ -61,7 +61,7 @@ from decimal import Decimal
 from enum import IntFlag
 from io import BytesIO, TextIOBase
 from types import GeneratorType
-from typing import Union
+from typing import NamedTuple, Callable, List, Union
 
 from amazon.ion.reader_text import text_reader
 from amazon.ion.writer_text import text_writer
@@ -71,7 +71,7 @@ from .reader import blocking_reader, NEXT_EVENT
 from .reader_binary import binary_reader
 from .reader_managed import managed_reader
 from .simple_types import IonPyList, IonPyDict, IonPyNull, IonPyBool, IonPyInt, IonPyFloat, IonPyDecimal, \
-    IonPyTimestamp, IonPyText, IonPyBytes, IonPySymbol, is_null
+    IonPyTimestamp, IonPyText, IonPyBytes, IonPySymbol, IonPyStdDict, is_null
 from .symbols import SymbolToken
 from .writer import blocking_writer
 from .writer_binary import binary_writer
@@ -260,7 +260,6 @@ def load(fp, catalog=None, single_value=True, parse_eagerly=True,
             default). When the C extension is disabled, there is no limit on the size of text values.
         value_model (IonPyValueModel): Controls the types of values that are emitted from load(s).
             Default: IonPyValueModel.ION_PY. See the IonPyValueModel class for more information.
-            NOTE: this option only has an effect when the C extension is enabled (which is the default).
     Returns (Any):
         if single_value is True:
             A Python object representing a single Ion value.
@@ -271,7 +270,8 @@ def load(fp, catalog=None, single_value=True, parse_eagerly=True,
         return load_extension(fp, parse_eagerly=parse_eagerly, single_value=single_value,
                               text_buffer_size_limit=text_buffer_size_limit, value_model=value_model)
     else:
-        return load_python(fp, catalog=catalog, single_value=single_value, parse_eagerly=parse_eagerly)
+        return load_python(fp, catalog=catalog, single_value=single_value, parse_eagerly=parse_eagerly,
+                           value_model=value_model)
 
 
 def loads(ion_str: Union[bytes, str], catalog=None, single_value=True, parse_eagerly=True,
@@ -387,8 +387,9 @@ def _dump(obj, writer, from_type, field=None, in_struct=False, depth=0):
     writer.send(event)
 
 
-def load_python(fp, catalog=None, single_value=True, parse_eagerly=True):
+def load_python(fp, catalog=None, single_value=True, parse_eagerly=True, value_model=IonPyValueModel.ION_PY):
     """'pure' Python implementation. Users should prefer to call ``load``."""
+    constructors = _value_model_constructors(value_model)
     if isinstance(fp, _TEXT_TYPES):
         raw_reader = text_reader(is_unicode=True)
     else:
@@ -402,14 +403,14 @@ def load_python(fp, catalog=None, single_value=True, parse_eagerly=True):
     reader = blocking_reader(managed_reader(raw_reader, catalog), fp)
     if parse_eagerly:
         out = []  # top-level
-        _load(out, reader)
+        _load(out, reader, constructors=constructors)
         if single_value:
             if len(out) != 1:
                 raise IonException('Stream contained %d values; expected a single value.' % (len(out),))
             return out[0]
         return out
     else:
-        out = _load_iteratively(reader)
+        out = _load_iteratively(reader, constructors=constructors)
         if single_value:
             result = next(out)
             try:
@@ -436,45 +437,165 @@ _FROM_ION_TYPE = [
     IonPyDict
 ]
 
+# The bound from_event constructors, indexed by IonType like _FROM_ION_TYPE.
+_FROM_EVENT = [ion_py_type.from_event for ion_py_type in _FROM_ION_TYPE]
 
-def _load_iteratively(reader, end_type=IonEventType.STREAM_END):
-    event = reader.send(NEXT_EVENT)
+# The from_event constructors for non-null scalar events. Scalar events of the null and container types can only
+# hold nulls, so they map to IonPyNull and the load loops need no per-value type checks.
+_FROM_SCALAR_EVENT = [
+    IonPyNull.from_event if ion_type is IonType.NULL or ion_type.is_container else from_event
+    for ion_type, from_event in zip(IonType, _FROM_EVENT)
+]
+
+
+class _ValueConstructors(NamedTuple):
+    """The functions that materialize load_python values from reader events for a value model.
+
+    Args:
+        null (Callable): Materializes scalar events holding a null.
+        scalar (List[Callable]): Materializes non-null scalar events, indexed by IonType.
+        container (List[Callable]): Materializes the (empty) value for container start events, indexed by IonType.
+    """
+    null: Callable
+    scalar: List[Callable]
+    container: List[Callable]
+
+
+_ION_PY_CONSTRUCTORS = _ValueConstructors(IonPyNull.from_event, _FROM_SCALAR_EVENT, _FROM_EVENT)
+
+
+def _symbol_text(event):
+    text = event.value.text
+    if text is None:
+        raise IonException('Cannot emit symbol with undefined text when SYMBOL_AS_TEXT is set.')
+    return text
+
+
+def _text_symbol_from_event(event):
+    return IonPyText.from_value(IonType.SYMBOL, _symbol_text(event), event.annotations)
+
+
+def _bare_text_symbol_from_event(event):
+    if event.annotations:
+        return _text_symbol_from_event(event)
+    return _symbol_text(event)
+
+
+def _std_dict_from_event(event):
+    return IonPyStdDict(event.annotations)
+
+
+def _bare_std_dict_from_event(event):
+    if event.annotations:
+        return IonPyStdDict(event.annotations)
+    return {}
+
+
+def _bare_null_from_event(event):
+    if event.annotations or event.ion_type is not IonType.NULL:
+        return IonPyNull.from_event(event)
+    return None
+
+
+def _bare_list_from_event(event):
+    if event.annotations:
+        return IonPyList.from_event(event)
+    return []
+
+
+def _bare_blob_from_event(event):
+    if event.annotations:
+        return IonPyBytes.from_event(event)
+    # The binary reader may hand out a view of its buffer.
+    return bytes(event.value)
+
+
+def _bare_from_event(from_event):
+    """Returns a function that materializes the event's value as is, unless it is annotated."""
+    def bare_from_event(event):
+        if event.annotations:
+            return from_event(event)
+        return event.value
+    return bare_from_event
+
+
+def _value_model_constructors(value_model):
+    """Returns the :class:`_ValueConstructors` implementing the given :class:`IonPyValueModel` flags.
+
+    This mirrors the C extension: clobs and sexps are always IonPy values so they can be told apart from blobs
+    and lists, and there is no bare multi-map for structs.
+    """
+    if value_model == IonPyValueModel.ION_PY:
+        return _ION_PY_CONSTRUCTORS
+
+    null = IonPyNull.from_event
+    scalar = list(_FROM_SCALAR_EVENT)
+    container = list(_FROM_EVENT)
+    if value_model & IonPyValueModel.MAY_BE_BARE:
+        null = _bare_null_from_event
+        for ion_type in (IonType.BOOL, IonType.INT, IonType.FLOAT, IonType.DECIMAL, IonType.TIMESTAMP,
+                         IonType.SYMBOL, IonType.STRING):
+            scalar[ion_type] = _bare_from_event(scalar[ion_type])
+        scalar[IonType.BLOB] = _bare_blob_from_event
+        container[IonType.LIST] = _bare_list_from_event
+    if value_model & IonPyValueModel.SYMBOL_AS_TEXT:
+        if value_model & IonPyValueModel.MAY_BE_BARE:
+            scalar[IonType.SYMBOL] = _bare_text_symbol_from_event
+        else:
+            scalar[IonType.SYMBOL] = _text_symbol_from_event
+    if value_model & IonPyValueModel.STRUCT_AS_STD_DICT:
+        if value_model & IonPyValueModel.MAY_BE_BARE:
+            container[IonType.STRUCT] = _bare_std_dict_from_event
+        else:
+            container[IonType.STRUCT] = _std_dict_from_event
+    return _ValueConstructors(null, scalar, container)
+
+
+def _load_iteratively(reader, end_type=IonEventType.STREAM_END, constructors=_ION_PY_CONSTRUCTORS):
+    from_null_event, from_scalar_event, from_container_event = constructors
+    send = reader.send
+    event = send(NEXT_EVENT)
     while event.event_type is not end_type:
         ion_type = event.ion_type
         if event.event_type is IonEventType.CONTAINER_START:
-            container = _FROM_ION_TYPE[ion_type].from_event(event)
-            _load(container, reader, IonEventType.CONTAINER_END, ion_type is IonType.STRUCT)
+            container = from_container_event[ion_type](event)
+            _load(container, reader, IonEventType.CONTAINER_END, ion_type is IonType.STRUCT, constructors)
             yield container
         elif event.event_type is IonEventType.SCALAR:
-            if event.value is None or ion_type is IonType.NULL or ion_type.is_container:
-                scalar = IonPyNull.from_event(event)
+            if event.value is None:
+                scalar = from_null_event(event)
             else:
-                scalar = _FROM_ION_TYPE[ion_type].from_event(event)
+                scalar = from_scalar_event[ion_type](event)
             yield scalar
-        event = reader.send(NEXT_EVENT)
-
+        event = send(NEXT_EVENT)
 
-def _load(out, reader, end_type=IonEventType.STREAM_END, in_struct=False):
-    def add(obj):
-        if in_struct:
-            out.add_item(event.field_name.text, obj)
-        else:
-            out.append(obj)
 
-    event = reader.send(NEXT_EVENT)
+def _load(out, reader, end_type=IonEventType.STREAM_END, in_struct=False, constructors=_ION_PY_CONSTRUCTORS):
+    from_null_event, from_scalar_event, from_container_event = constructors
+    if in_struct:
+        # Standard dicts keep only the last value for a field, like json.
+        add_item = out.add_item if isinstance(out, IonPyDict) else out.__setitem__
+    send = reader.send
+    event = send(NEXT_EVENT)
     while event.event_type is not end_type:
+        event_type = event.event_type
         ion_type = event.ion_type
-        if event.event_type is IonEventType.CONTAINER_START:
-            container = _FROM_ION_TYPE[ion_type].from_event(event)
-            _load(container, reader, IonEventType.CONTAINER_END, ion_type is IonType.STRUCT)
-            add(container)
-        elif event.event_type is IonEventType.SCALAR:
-            if event.value is None or ion_type is IonType.NULL or event.ion_type.is_container:
-                scalar = IonPyNull.from_event(event)
+        if event_type is IonEventType.SCALAR:
+            if event.value is None:
+                value = from_null_event(event)
             else:
-                scalar = _FROM_ION_TYPE[ion_type].from_event(event)
-            add(scalar)
-        event = reader.send(NEXT_EVENT)
+                value = from_scalar_event[ion_type](event)
+        elif event_type is IonEventType.CONTAINER_START:
+            value = from_container_event[ion_type](event)
+            _load(value, reader, IonEventType.CONTAINER_END, ion_type is IonType.STRUCT, constructors)
+        else:
+            event = send(NEXT_EVENT)
+            continue
+        if in_struct:
+            add_item(event.field_name.text, value)
+        else:
+            out.append(value)
+        event = send(NEXT_EVENT)
 
 
 def dump_extension(obj, fp, binary=True, sequence_as_stream=False, tuple_as_sexp=False, omit_version_marker=False):
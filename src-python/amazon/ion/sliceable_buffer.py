@@ -12,6 +12,11 @@ class SliceableBuffer:
 
     Built with the assumption that chunks will be reasonably large and that
     relatively few (single digit) chunks will be buffered at once.
+
+    Extending never copies bytes: chunks are held as memoryviews and only the
+    (short) list of chunks is copied. Immutability is relied upon by the
+    binary reader, which resumes from the buffer it held before a read that
+    raised IncompleteReadError once more data arrives.
     """
 
     @staticmethod
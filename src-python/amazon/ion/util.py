@@ -118,6 +118,26 @@ def coroutine(func):
     return wrapper
 
 
+class _SharedCache(dict):
+    """A dictionary of immutable objects that recur across a stream, such as tokens, events, and annotation tuples.
+
+    Because the values are immutable, every holder can reference the same instance rather than an equal copy. Lookups
+    use the inherited :meth:`dict.get`; the cache is cleared once it holds ``max_size`` entries, so streams with many
+    distinct keys cannot grow it without bound.
+    """
+
+    def __init__(self, max_size=4096):
+        super().__init__()
+        self.max_size = max_size
+
+    def share(self, key, value):
+        """Stores ``value`` for ``key`` and returns it."""
+        if len(self) >= self.max_size:
+            self.clear()
+        self[key] = value
+        return value
+
+
 _NON_BMP_OFFSET = 0x10000
 _UTF_16_MAX_CODE_POINT = 0xFFFF
 _HIGH_SURROGATE_START = 0xD800
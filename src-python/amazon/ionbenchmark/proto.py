@@ -112,7 +112,6 @@ def get_message_type_from_descriptor_set(type_name, descriptor_set_file):
     from google.protobuf import message as _message
     from google.protobuf import message_factory as _message_factory
     from google.protobuf import reflection as _reflection
-    import six
 
     descriptor_set = _descriptor_pb2.FileDescriptorSet()
 
@@ -122,7 +121,7 @@ def get_message_type_from_descriptor_set(type_name, descriptor_set_file):
     messages_types = _message_factory.GetMessages(descriptor_set.file)
     message_type = messages_types[type_name]()
 
-    class DynamicMessage(six.with_metaclass(_reflection.GeneratedProtocolMessageType, _message.Message)):
+    class DynamicMessage(_message.Message, metaclass=_reflection.GeneratedProtocolMessageType):
         DESCRIPTOR = message_type.DESCRIPTOR
 
     return DynamicMessage
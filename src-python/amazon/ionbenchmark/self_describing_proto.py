@@ -7,8 +7,6 @@ from google.protobuf import reflection as _reflection
 
 from self_describing_proto_pb2 import SelfDescribingMessage
 
-import six
-
 
 class SelfDescribingProtoSerde:
     """
@@ -49,7 +47,7 @@ class SelfDescribingProtoSerde:
         messages_types = _message_factory.GetMessages(descriptor_set.file)
         message_type = messages_types[type_name]()
 
-        class DynamicMessage(six.with_metaclass(_reflection.GeneratedProtocolMessageType, _message.Message)):
+        class DynamicMessage(_message.Message, metaclass=_reflection.GeneratedProtocolMessageType):
             DESCRIPTOR = message_type.DESCRIPTOR
 
         return DynamicMessage
@@ -11,13 +11,13 @@
 # OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the
 # License.
-from typing import NamedTuple, Sequence
+from typing import Callable, NamedTuple, Optional, Sequence
 
 from pytest import raises
 
 from tests import is_exception, listify
 
-from amazon.ion.core import IonEventType
+from amazon.ion.core import IonEventType, IonThunkEvent
 from tests.event_aliases import END
 from tests.event_aliases import NEXT
 
@@ -46,21 +46,63 @@ class ReaderParameter(NamedTuple):
     desc: str
     event_pairs: Sequence
     is_unicode: bool = False
+    check: Optional[Callable[[Sequence], None]] = None
 
     def __str__(self):
         return self.desc
 
 
-def reader_scaffold(reader, event_pairs):
+def reader_scaffold(reader, event_pairs, check=None):
+    """Drives ``reader`` with the input side of ``event_pairs``, asserting that it produces the output side.
+
+    If given, ``check`` is called with the events the reader produced, in the order of ``event_pairs``, so that
+    properties beyond equality (such as laziness or object sharing) can be asserted.
+    """
     input_events = (e for e, _ in event_pairs)
     output_events = add_depths(e for _, e in event_pairs)
+    actual_events = []
     for read_event, expected in zip(input_events, output_events):
         if is_exception(expected):
             with raises(expected):
                 reader.send(read_event).value  # Forces evaluation of all value thunks.
         else:
             actual = reader.send(read_event)
+            actual_events.append(actual)
             assert expected == actual
+    if check is not None:
+        check(actual_events)
+
+
+def lazy(*indices):
+    """Returns a check that the events at ``indices`` were produced as :class:`IonThunkEvent`."""
+    def check(events):
+        for i in indices:
+            assert isinstance(events[i], IonThunkEvent)
+    return check
+
+
+def eager(*indices):
+    """Returns a check that the events at ``indices`` were produced with their values already materialized."""
+    def check(events):
+        for i in indices:
+            assert not isinstance(events[i], IonThunkEvent)
+    return check
+
+
+def same_event(*indices):
+    """Returns a check that the events at ``indices`` are the same object."""
+    def check(events):
+        for i in indices[1:]:
+            assert events[i] is events[indices[0]]
+    return check
+
+
+def same_field_name(*indices):
+    """Returns a check that the events at ``indices`` share the same field name token object."""
+    def check(events):
+        for i in indices[1:]:
+            assert events[i].field_name is events[indices[0]].field_name
+    return check
 
 
 def value_iter(event_func, values, *args):
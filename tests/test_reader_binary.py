@@ -17,7 +17,8 @@ from itertools import chain
 from random import Random
 
 from tests import parametrize, listify
-from tests.reader_util import reader_scaffold, ReaderParameter, all_top_level_as_one_stream_params, value_iter
+from tests.reader_util import reader_scaffold, ReaderParameter, all_top_level_as_one_stream_params, value_iter, lazy, \
+    eager, same_event, same_field_name
 from tests.event_aliases import *
 
 from amazon.ion.core import IonType, timestamp, TimestampPrecision, OffsetTZInfo
@@ -117,6 +118,9 @@ _BAD_VALUES = (
     (b'\xe4\x81\x84\xb2\x21\x01', 'ANNOT LENGTH TOO SHORT - CONTAINER'),
     # The annotation wrapper declares 3 octets, but the subfields (including an int) take up four.
     (b'\xe3\x81\x84\x21\x01', 'ANNOT LENGTH TOO SHORT - SCALAR'),
+    # Short strings are decoded as soon as they are read, so invalid UTF-8 must surface as an Ion error there.
+    (b'\x82\xff\xfe', 'INVALID UTF-8 - SHORT STRING'),
+    (b'\x8e\xc1' + b'\xff' * 65, 'INVALID UTF-8 - LONG STRING'),
     # TODO: annnotated nop is a fail
 
     # TODO: value within container is longer than container.
@@ -133,6 +137,65 @@ def _bad_params():
             ]
         )
 
+
+# These scalar values are decoded from the buffered bytes only when the event's value is first requested.
+_LAZY_VALUES = (
+    (b'\x8E\xC1' + b'a' * 65, e_string(u'a' * 65), 'LONG STRING'),
+    (b'\x52\xC1\x01', e_decimal(Decimal('1e-1')), 'DECIMAL'),
+    (b'\x63\xC0\x0F\xE0', e_timestamp(_ts(2016, precision=_PREC_YEAR)), 'TIMESTAMP'),
+)
+
+# Ints, symbols, and short strings are cheaper to decode immediately than to defer.
+_EAGER_VALUES = (
+    (b'\x83abc', e_string(u'abc'), 'SHORT STRING'),
+    (b'\x71\x04', e_symbol(SymbolToken(None, 4)), 'SYMBOL'),
+    (b'\x21\x01', e_int(1), 'INT'),
+    (b'\x32\x01\x00', e_int(-256), 'NEGATIVE INT'),
+)
+
+
+def _laziness_params():
+    for values, desc, check in ((_LAZY_VALUES, 'LAZY', lazy(3)), (_EAGER_VALUES, 'EAGER', eager(3))):
+        for data, event, value_desc in values:
+            yield _P(
+                desc='%s %s' % (desc, value_desc),
+                event_pairs=_IVM_PAIRS + [
+                    (NEXT, END),
+                    (e_read(data), event),
+                    (NEXT, END),
+                ],
+                check=check,
+            )
+
+
+_SHARING_PARAMS = (
+    _P(
+        desc='SHARED FIELD NAMES',
+        event_pairs=_IVM_PAIRS + [
+            (NEXT, END),
+            (e_read(b'\xD2\x84\x0F\xD2\x84\x0F'), e_start_struct()),
+            (NEXT, e_null(field_name=SymbolToken(None, 4))),
+            (NEXT, e_end_struct()),
+            (NEXT, e_start_struct()),
+            (NEXT, e_null(field_name=SymbolToken(None, 4))),
+            (NEXT, e_end_struct()),
+            (NEXT, END),
+        ],
+        check=same_field_name(4, 7),
+    ),
+    _P(
+        desc='SHARED STATIC SCALARS',
+        event_pairs=_IVM_PAIRS + [
+            (NEXT, END),
+            (e_read(b'\x0F\x11\x0F'), e_null()),
+            (NEXT, e_bool(True)),
+            (NEXT, e_null()),
+            (NEXT, END),
+        ],
+        check=same_event(3, 5),
+    ),
+)
+
 # This is an encoding of a single top-level value and the expected events with ``NEXT``.
 _TOP_LEVEL_VALUES = (
     (b'\x0F', e_null()),
@@ -418,6 +481,8 @@ def _containerize_params(params, with_skip=True):
 @parametrize(*chain(
     _BASIC_PARAMS,
     _bad_params(),
+    _laziness_params(),
+    _SHARING_PARAMS,
     _prepend_ivm(_top_level_value_params()),
     _prepend_ivm(_annotate_params(_top_level_value_params())),
     _prepend_ivm(_containerize_params(_top_level_value_params())),
@@ -429,4 +494,4 @@ def _containerize_params(params, with_skip=True):
     _prepend_ivm(all_top_level_as_one_stream_params(_top_level_iter)),
 ))
 def test_raw_reader(p):
-    reader_scaffold(stream_handler(), p.event_pairs)
+    reader_scaffold(stream_handler(), p.event_pairs, p.check)
@@ -11,13 +11,14 @@
 # OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the
 # License.
+import re
 from typing import Callable, Sequence, NamedTuple
 
 from pytest import raises
 
 from tests import parametrize
 
-from amazon.ion.reader import BufferQueue, CodePointArray
+from amazon.ion.reader import BufferQueue, CodePointArray, _EOF
 
 
 def read(expected):
@@ -65,6 +66,38 @@ def skip(amount, expected_rem=0):
     return action
 
 
+def skip_until(targets, expected_skipped):
+    def action(queue):
+        skipped = queue.skip_until(tuple(iter(targets)))
+        assert expected_skipped == skipped
+        return -skipped, skipped
+
+    return action
+
+
+def read_match(pattern, expected):
+    def action(queue):
+        matched = queue.read_match(re.compile(pattern))
+        assert expected == matched
+        return -len(matched), len(matched)
+
+    return action
+
+
+def read_byte_after(pattern, expected):
+    def action(queue):
+        size = len(queue)
+        actual = queue.read_byte_after(re.compile(pattern))
+        if expected is None or BufferQueue.is_eof(expected):
+            assert expected is actual
+        else:
+            assert ord(expected) == actual
+        consumed = size - len(queue)
+        return -consumed, consumed
+
+    return action
+
+
 def extend(data):
     def action(queue):
         queue.extend(data)
@@ -303,6 +336,101 @@ class _P(NamedTuple):
             read(b'n')
         ],
     ),
+    _P(
+        desc='SKIP UNTIL',
+        actions=[
+            extend(b'abcd'),
+            extend(b'ef\ngh'),
+            read_byte(b'a'),
+            skip_until(b'\r\n', 5),
+            read_byte(b'\n'),
+            skip_until(b'\n', 2),
+            skip_until(b'\n', 0),
+        ],
+    ),
+    _P(
+        desc='SKIP UNTIL FIRST OF MANY',
+        actions=[
+            extend(b'ab\ncd\r'),
+            skip_until(b'\r\n', 2),
+            read_byte(b'\n'),
+            unread_byte(b'\n'),
+            read_byte(b'\n'),
+            skip_until(b'\r\n', 2),
+            read_byte(b'\r'),
+        ],
+    ),
+    _P(
+        desc='SKIP UNTIL EOF',
+        actions=[
+            extend(b'ab'),
+            mark_eof(),
+            skip_until(b'*', 2),
+            expect_eof(True),
+        ],
+    ),
+    _P(
+        desc='SKIP UNTIL UNICODE',
+        actions=[
+            extend(u'a\U0001f4a9'),
+            extend(u'c*d'),
+            skip_until(b'*', len(u'a\U0001f4a9c')),
+            read_byte(u'*'),
+        ],
+        is_unicode=True
+    ),
+    _P(
+        desc='READ MATCH',
+        actions=[
+            extend(b'ab1'),
+            extend(b'2 cd'),
+            read_match(b'[a-z0-9]+', b'ab1'),
+            read_match(b'[a-z0-9]+', b'2'),
+            read_match(b'[a-z0-9]+', b''),
+            read_byte(b' '),
+            mark_eof(),
+            read_match(b'[a-z]+', b'cd'),
+            read_match(b'[a-z]+', b''),
+            expect_eof(True),
+        ],
+    ),
+    _P(
+        desc='READ MATCH UNICODE',
+        actions=[
+            extend(u'\U0001f4a9ab'),
+            read_match(u'[a-z]+', u''),
+            read_byte(u'\U0001f4a9'),
+            read_match(u'[a-z]+', u'ab'),
+        ],
+        is_unicode=True
+    ),
+    _P(
+        desc='READ BYTE AFTER',
+        actions=[
+            extend(b'  a'),
+            extend(b' b  '),
+            extend(b'c'),
+            read_byte_after(b' +', b'a'),
+            read_byte_after(b' +', b'b'),
+            read_byte_after(b' +', b'c'),
+            read_byte_after(b' +', None),
+            extend(b'd '),
+            read_byte_after(b' +', b'd'),
+            read_byte_after(b' +', None),
+            extend(b' '),
+            mark_eof(),
+            read_byte_after(b' +', _EOF),
+        ],
+    ),
+    _P(
+        desc='READ BYTE AFTER UNICODE',
+        actions=[
+            extend(u' \U0001f4a9 '),
+            read_byte_after(u' +', u'\U0001f4a9'),
+            read_byte_after(u' +', None),
+        ],
+        is_unicode=True
+    ),
     _P(
         desc='EOF',
         actions=[
@@ -20,7 +20,8 @@ from tests.reader_util import reader_scaffold, add_depths
 from tests.event_aliases import *
 
 from amazon.ion.exceptions import IonException, CannotSubstituteTable
-from amazon.ion.reader_managed import managed_reader, _ImportDesc, _IonManagedThunkEvent
+from amazon.ion.reader_managed import managed_reader, _ImportDesc, _IonManagedThunkEvent, _managed_thunk_event, \
+    _ManagedContext
 from amazon.ion.symbols import shared_symbol_table, local_symbol_table, \
                                SymbolToken, ImportLocation, \
                                SymbolTableCatalog, \
@@ -449,3 +450,13 @@ def test_managed_thunk_event():
 
     assert thunk_event.derive_field_name(lambda: _tok(u'bar', None)) \
         == event.derive_field_name(_tok(u'bar', None))
+
+
+def test_managed_annotations_are_shared():
+    ctx = _ManagedContext(SymbolTableCatalog())
+    first = _managed_thunk_event(ctx, e_int(1, annotations=(_tok(None, 4),)))
+    second = _managed_thunk_event(ctx, e_int(2, annotations=(_tok(None, 4),)))
+
+    assert first.annotations[0].text == TEXT_NAME
+    assert first.annotations is second.annotations
+    assert _managed_thunk_event(ctx, e_int(3)).annotations == ()
@@ -23,7 +23,8 @@ from amazon.ion.symbols import SymbolToken
 from amazon.ion.util import coroutine
 from tests import listify, parametrize
 from tests.event_aliases import *
-from tests.reader_util import ReaderParameter, reader_scaffold, all_top_level_as_one_stream_params, value_iter
+from tests.reader_util import ReaderParameter, reader_scaffold, all_top_level_as_one_stream_params, value_iter, lazy, \
+    same_field_name
 
 _P = ReaderParameter
 _ts = timestamp
@@ -123,6 +124,7 @@ _BAD_GRAMMAR = (
     (b'{{ab=}}',),
     (b'{{ab=}=}',),
     (b'{{ab===}}',),
+    (b'{{a===}}',),
     (b'{{====}}',),
     (b'{{abcd====}}',),
     (b'{{abc*}}',),
@@ -317,6 +319,9 @@ _GOOD_FLUSH = (
     [(e_read(b"'abc'"), INC), (NEXT, e_symbol(_st(u'abc'))), _NEXT_END],
     [(e_read(b"$abc"), INC), (NEXT, e_symbol(_st(u'$abc'))), _NEXT_END],
     [(e_read(b"$"), INC), (NEXT, e_symbol(_st(u'$'))), _NEXT_END],
+    [(e_read(b'_'), INC), (NEXT, e_symbol(_st(u'_'))), _NEXT_END],
+    [(e_read(u'_'), INC), (NEXT, e_symbol(_st(u'_'))), _NEXT_END],
+    [(e_read(b'x::_'), INC), (NEXT, e_symbol(_st(u'_'), annotations=(_st(u'x'),))), _NEXT_END],
     [(e_read(b"$10"), INC), (NEXT, e_symbol(_sid(10))), _NEXT_END, (e_read(b'0'), INC), (NEXT, e_int(0)), _NEXT_END],
     [(e_read(b'abc'), INC), (NEXT, e_symbol(_st(u'abc'))), _NEXT_END, (e_read(b'def'), INC),
      (NEXT, e_symbol(_st(u'def'))), _NEXT_END],
@@ -357,6 +362,20 @@ _BAD_FLUSH = (
     [(e_read(b'[/*'), e_start_list()), _NEXT_INC, _NEXT_ERROR],
     [(e_read(b'(//'), e_start_sexp()), _NEXT_INC, _NEXT_ERROR],
     [(e_read(b'(//\n'), e_start_sexp()), _NEXT_INC, _NEXT_ERROR],
+    [(e_read(b'(null'), e_start_sexp()), _NEXT_INC, _NEXT_ERROR],
+    [(e_read(b'(nan'), e_start_sexp()), _NEXT_INC, _NEXT_ERROR],
+    [(e_read(b'[true'), e_start_list()), _NEXT_INC, _NEXT_ERROR],
+    [(e_read(b'{a:false'), e_start_struct()), _NEXT_INC, _NEXT_ERROR],
+    [(e_read(b'(123'), e_start_sexp()), _NEXT_INC, _NEXT_ERROR],
+    [(e_read(b'[123'), e_start_list()), _NEXT_INC, _NEXT_ERROR],
+    [(e_read(b'($1'), e_start_sexp()), _NEXT_INC, _NEXT_ERROR],
+    [(e_read(b'($ion'), e_start_sexp()), _NEXT_INC, _NEXT_ERROR],
+    [(e_read(b'[$ion'), e_start_list()), _NEXT_INC, _NEXT_ERROR],
+    [(e_read(b'[$12'), e_start_list()), _NEXT_INC, _NEXT_ERROR],
+    [(e_read(b'(foo'), e_start_sexp()), _NEXT_INC, _NEXT_ERROR],
+    [(e_read(b'[foo'), e_start_list()), _NEXT_INC, _NEXT_ERROR],
+    [(e_read(b'{'), INC), _NEXT_ERROR],
+    [(e_read(b'-'), INC), _NEXT_ERROR],
     [(e_read(b'+in'), INC), _NEXT_ERROR],
     [(e_read(b'null.'), INC), _NEXT_ERROR],
     [(e_read(b'null.str'), INC), _NEXT_ERROR],
@@ -1202,7 +1221,7 @@ def _basic_params(event_func, desc, delimiter, data_event_pairs, is_delegate=Fal
             break
 
 
-def _paired_params(params, desc, top_level=True):
+def _paired_params(params, desc, top_level=True, check=None):
     """Generates reader parameters from sequences of input/output event pairs."""
     for event_pairs in params:
         data = event_pairs[0][0].data
@@ -1211,10 +1230,40 @@ def _paired_params(params, desc, top_level=True):
         yield _P(
             desc='%s %s' % (desc, data),
             event_pairs=event_pairs,
-            is_unicode=isinstance(data, str)
+            is_unicode=isinstance(data, str),
+            check=check
         )
 
 
+# Numeric, timestamp, and lob values are parsed only when the event's value is first requested, so skipping over them
+# never pays for the conversion.
+_LAZY = (
+    [(e_read(b'0 '), e_int(0)), _NEXT_END],
+    [(e_read(b'1.5 '), e_decimal(_d(u'1.5'))), _NEXT_END],
+    [(e_read(b'1e0 '), e_float(1.0)), _NEXT_END],
+    [(e_read(b'0x1F '), e_int(31)), _NEXT_END],
+    [(e_read(b'2007-01-01T '), e_timestamp(_ts(2007, 1, 1, precision=_tp.DAY))), _NEXT_END],
+    [
+        (e_read(b'2007-02-23T12:14:33.079-08:00 '), e_timestamp(_ts(
+            2007, 2, 23, 12, 14, 33, 79000, off_hours=-8, off_minutes=0, precision=_tp.SECOND, fractional_precision=3
+        ))),
+        _NEXT_END
+    ],
+    [(e_read(b'{{YQ==}}'), e_blob(b'a')), _NEXT_END],
+)
+
+_SHARED_FIELD_NAMES = (
+    [
+        (e_read(b'{abc:1} {abc:2} '), e_start_struct()),
+        (NEXT, e_int(1, field_name=_st(u'abc'))),
+        (NEXT, e_end_struct()),
+        (NEXT, e_start_struct()),
+        (NEXT, e_int(2, field_name=_st(u'abc'))),
+        (NEXT, e_end_struct()),
+        _NEXT_END
+    ],
+)
+
 _ion_exception = partial(_expect_event, IonException)
 _bad_grammar_params = partial(_basic_params, _ion_exception, 'BAD GRAMMAR', b' ')
 _bad_unicode_params = partial(_basic_params, _ion_exception, 'BAD GRAMMAR - UNICODE', u' ')
@@ -1243,6 +1292,8 @@ _good_unicode_params = partial(_basic_params, _end, 'GOOD - UNICODE', u'')
     _paired_params(_SKIP, 'SKIP'),
     _paired_params(_GOOD_FLUSH, 'GOOD FLUSH'),
     _paired_params(_BAD_FLUSH, 'BAD FLUSH'),
+    _paired_params(_LAZY, 'LAZY', check=lazy(1)),
+    _paired_params(_SHARED_FIELD_NAMES, 'SHARED FIELD NAMES', check=same_field_name(2, 5)),
     # All top-level values as individual data events, space-delimited.
     _top_level_value_params(),
     # All top-level values as one data event, space-delimited.
@@ -1271,4 +1322,4 @@ _good_unicode_params = partial(_basic_params, _end, 'GOOD - UNICODE', u'')
     )),
 ))
 def test_raw_reader(p):
-    reader_scaffold(reader(is_unicode=p.is_unicode), p.event_pairs)
+    reader_scaffold(reader(is_unicode=p.is_unicode), p.event_pairs, p.check)
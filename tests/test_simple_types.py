@@ -23,7 +23,7 @@ from amazon.ion.core import Timestamp, TimestampPrecision
 from amazon.ion.symbols import SymbolToken
 from amazon.ion.simple_types import is_null, IonPyNull, IonPyBool, IonPyInt, IonPyFloat, \
     IonPyDecimal, IonPyTimestamp, IonPyText, IonPyBytes, \
-    IonPyList, IonPyDict, IonPySymbol
+    IonPyList, IonPyDict, IonPySymbol, IonPyStdDict
 from amazon.ion.equivalence import ion_equals
 from amazon.ion.simpleion import _ion_type, _FROM_TYPE
 
@@ -112,6 +112,24 @@ def test_event_types(p):
     assert p.event.annotations == value_output.ion_annotations
 
 
+@parametrize(
+    IonPyNull(),
+    IonPyFloat(1.5),
+    IonPyDecimal('1.5'),
+    IonPyText('abc'),
+    IonPyTimestamp(2024, 1, 2),
+    IonPyList([1]),
+    IonPyStdDict(),
+    IonPyDict({'a': 1}),
+)
+def test_slotted_types(value):
+    assert not hasattr(value, '__dict__')
+    assert value.ion_type is not None
+    assert value.ion_annotations == ()
+    value.ion_annotations = ('a',)
+    assert value.ion_annotations == ('a',)
+
+
 def test_subclass_types():
     class Foo(dict):
         pass
@@ -759,6 +759,14 @@ def test_ionc_timestamp_read(params):
     assert ion_equals(value, expected)
 
 
+def _value_model_loaders():
+    """The load implementations that support value models."""
+    loaders = [simpleion.load_python]
+    if c_ext:
+        loaders.append(simpleion.load_extension)
+    return loaders
+
+
 @parametrize(
     ("31", int, 31),
     ("true", bool, True),
@@ -770,25 +778,23 @@ def test_ionc_timestamp_read(params):
     ('"bar"', str, "bar"),
     ("bar", SymbolToken, SymbolToken("bar", None, None)),
     ('{{ "foo" }}', IonPyBytes, lambda x: x.ion_type == IonType.CLOB),
+    ("{{ aGVsbG8= }}", bytes, b"hello"),
     ("[]", list, []),
     # regression test for sexp suppressing bare_values for children
     ("(31)", IonPyList, lambda x: x.ion_type == IonType.SEXP and type(x[0]) == int),
     ("foo::31", IonPyInt, lambda x: len(x.ion_annotations) == 1)
 )
 def test_bare_values(params):
-    # This function only tests c extension
-    if not c_ext:
-        return
-
     ion_text, expected_type, expectation = params
 
-    value = simpleion.load_extension(StringIO(ion_text), value_model=IonPyValueModel.MAY_BE_BARE)
+    for loader in _value_model_loaders():
+        value = loader(StringIO(ion_text), value_model=IonPyValueModel.MAY_BE_BARE)
 
-    assert type(value) is expected_type
-    if callable(expectation):
-        expectation(value)
-    else:
-        assert ion_equals(value, expectation)
+        assert type(value) is expected_type
+        if callable(expectation):
+            expectation(value)
+        else:
+            assert ion_equals(value, expectation)
 
 
 @parametrize(
@@ -810,37 +816,30 @@ def test_bare_values(params):
     ("{}", IonPyValueModel.SYMBOL_AS_TEXT, IonPyDict),
 )
 def test_value_model_flags(params):
-    # This function only tests c extension
-    if not c_ext:
-        return
-
     if len(params) == 3:
         ion_text, value_model, expected_type = params
         expected_ion_type = None
     else:
         ion_text, value_model, expected_type, expected_ion_type = params
 
-    value = simpleion.load_extension(StringIO(ion_text), value_model=value_model)
-    assert type(value) is expected_type
-    if expected_ion_type:
-        assert value.ion_type == expected_ion_type
+    for loader in _value_model_loaders():
+        value = loader(StringIO(ion_text), value_model=value_model)
+        assert type(value) is expected_type
+        if expected_ion_type:
+            assert value.ion_type == expected_ion_type
 
 
 def test_stddict():
     """Verifies that STRUCT_AS_STD_DICT is consistent with json in keeping
     only the last of a duplicated field.
     """
-
-    # This function only tests c extension
-    if not c_ext:
-        return
-
     ion_text = '{ foo: "bar", foo: "baz" }'
 
-    ionpyvalue = simpleion.load_extension(StringIO(ion_text), value_model=IonPyValueModel.STRUCT_AS_STD_DICT)
-    barevalue = simpleion.load_extension(StringIO(ion_text), value_model=IonPyValueModel.STRUCT_AS_STD_DICT | IonPyValueModel.MAY_BE_BARE)
+    for loader in _value_model_loaders():
+        ionpyvalue = loader(StringIO(ion_text), value_model=IonPyValueModel.STRUCT_AS_STD_DICT)
+        barevalue = loader(StringIO(ion_text), value_model=IonPyValueModel.STRUCT_AS_STD_DICT | IonPyValueModel.MAY_BE_BARE)
 
-    assert ionpyvalue["foo"] == barevalue["foo"] == "baz"
+        assert ionpyvalue["foo"] == barevalue["foo"] == "baz"
 
 
 def test_undefined_symbol_text_as_text():
@@ -856,6 +855,15 @@ def test_undefined_symbol_text_as_text():
         simpleion.load_extension(StringIO(ion_text), value_model=IonPyValueModel.SYMBOL_AS_TEXT)
 
 
+def test_undefined_symbol_text_as_text_python():
+    ion_text = """
+    $ion_symbol_table::{ imports:[ { name:"missing", version:1, max_id:1 } ] }
+    $10
+    """
+    with raises(IonException, match="Cannot emit symbol with undefined text"):
+        simpleion.load_python(StringIO(ion_text), value_model=IonPyValueModel.SYMBOL_AS_TEXT)
+
+
 # See issue https://github.com/amazon-ion/ion-python/issues/232
 def test_loads_large_string():
     # This function only tests c extension